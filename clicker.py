@@ -98,13 +98,9 @@ class MouseClicker:
             print(f"Using dedicated click position: {click_position}")
         # Legacy fallback to first condition position
         elif hasattr(rule, 'conditions') and rule.conditions:
-            click_position = rule.conditions[0].position
+            # For area positions, this is the center of the area
+            click_position = rule.conditions[0].center
             print(f"Using first condition position for click: {click_position}")
-            # For area positions, use center of area
-            if len(click_position) == 4:
-                x1, y1, x2, y2 = click_position
-                click_position = ((x1 + x2) // 2, (y1 + y2) // 2)
-                print(f"Using center of area for click: {click_position}")
         else:
             print("Error: No position available in rule for clicking")
             return False
@@ -1,10 +1,14 @@
-from dataclasses import dataclass
+import itertools
+from dataclasses import dataclass, field
 from typing import List, Literal, Optional, Union
 try:  # Local import; optional safety
     from version import __version__ as APP_VERSION
 except Exception:
     APP_VERSION = "0.0.0"
 
+# Source of Condition.revision values; unique across all conditions
+_revisions = itertools.count()
+
 @dataclass
 class Condition:
     """Represents a single detection condition"""
@@ -13,10 +17,39 @@ class Condition:
     value: Union[tuple[int, int, int], str]  # RGB tuple for color, string for text
     comparator: Literal['equals', 'contains', 'similar'] = 'equals'
     tolerance: int = 10  # Tolerance for color matching (0-100)
+    # 'area' or 'point', derived from position and kept in sync on every assignment
+    kind: Literal['point', 'area'] = field(init=False, repr=False, compare=False)
+    # The point itself, or the center of the area; kept in sync like kind
+    center: tuple[int, int] = field(init=False, repr=False, compare=False)
+    # Changes on every field assignment; lets callers cache values derived from the condition
+    revision: int = field(init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == 'position':
+            if len(value) == 4:
+                x1, y1, x2, y2 = value
+                object.__setattr__(self, 'kind', 'area')
+                object.__setattr__(self, 'center', ((x1 + x2) // 2, (y1 + y2) // 2))
+            else:
+                object.__setattr__(self, 'kind', 'point')
+                object.__setattr__(self, 'center', tuple(value))
+        object.__setattr__(self, 'revision', next(_revisions))
     
     def is_area_selection(self) -> bool:
         """Check if this condition uses area selection (4 coordinates)"""
-        return len(self.position) == 4
+        return self.kind == 'area'
+    
+    @property
+    def key(self) -> tuple:
+        """Hashable content key (type, position, value, comparator, tolerance), rebuilt only after edits"""
+        cached = self.__dict__.get('_key')
+        if cached is not None and cached[0] == self.revision:
+            return cached[1]
+        value = tuple(self.value) if isinstance(self.value, list) else self.value
+        key = (self.type, tuple(self.position), value, self.comparator, self.tolerance)
+        object.__setattr__(self, '_key', (self.revision, key))
+        return key
 
 @dataclass
 class ConditionGroup:
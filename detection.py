@@ -12,10 +12,14 @@ import os
 import time
 import re
 import string
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Tuple, Union, List, Dict
+from typing import Iterable, Iterator, Optional, Tuple, Union, List, Dict
 from config import Condition
 
+# Region captured around a point condition, per condition type (OCR needs more context)
+POINT_REGION_SIZE = {'color': 20, 'text': 200}
+
 
 class DetectionEngine:
     """Handles detection of colors and text at specific screen positions"""
@@ -23,6 +27,20 @@ class DetectionEngine:
     def __init__(self):
         # Disable pyautogui failsafe for smoother operation
         pyautogui.FAILSAFE = False
+
+        # Reusable OCR preprocessing buffers (lazily resized per region shape)
+        self._buf: Dict[str, np.ndarray] = {}
+        self._morph_kernel = np.ones((2, 2), np.uint8)
+        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+
+        # Shared screenshot (left, top, BGR image) for the conditions of one batch
+        self._frame: Optional[Tuple[int, int, np.ndarray]] = None
+
+        # Condition type -> detector; each detector handles its own runtime errors
+        self._dispatch = {
+            'color': self.detect_color,
+            'text': self.detect_text,
+        }
         
         # Verify Tesseract OCR is available
         try:
@@ -38,10 +56,24 @@ class DetectionEngine:
             print("  👉 On macOS: brew install tesseract")
             print("  👉 If installed but not found: export TESSERACT_CMD=\"/opt/homebrew/bin/tesseract\"")
         
+    @staticmethod
+    def _region_bounds(position: Union[Tuple[int, int], Tuple[int, int, int, int]], region_size: int = 20) -> Tuple[int, int, int, int]:
+        """Return the (left, top, width, height) screen region for a point or area position."""
+        if len(position) == 4:
+            # Area selection: (x1, y1, x2, y2)
+            x1, y1, x2, y2 = position
+            return x1, y1, x2 - x1, y2 - y1
+        # Point selection: (x, y) - region centred on the point
+        x, y = position
+        return max(0, x - region_size // 2), max(0, y - region_size // 2), region_size, region_size
+
     def capture_screen_region(self, position: Union[Tuple[int, int], Tuple[int, int, int, int]], region_size: int = 20) -> np.ndarray:
         """
         Capture a region from the screen.
         
+        Inside a ``batch_capture`` block the region is cropped from the shared
+        screenshot when it lies within it; otherwise it is grabbed directly.
+        
         Args:
             position: Either (x, y) for point selection or (x1, y1, x2, y2) for area selection
             region_size: Size of the region to capture around point (ignored for area selection)
@@ -49,31 +81,57 @@ class DetectionEngine:
         Returns:
             numpy array representing the captured image region
         """
-        if len(position) == 4:
-            # Area selection: (x1, y1, x2, y2)
-            x1, y1, x2, y2 = position
-            left, top = x1, y1
-            width = x2 - x1
-            height = y2 - y1
-        else:
-            # Point selection: (x, y)
-            x, y = position
-            # Calculate region bounds around the point
-            left = max(0, x - region_size // 2)
-            top = max(0, y - region_size // 2)
-            width = region_size
-            height = region_size
-        
-        # Capture screenshot of the region
+        left, top, width, height = self._region_bounds(position, region_size)
+
+        if self._frame is not None:
+            frame_left, frame_top, frame_img = self._frame
+            x0, y0 = left - frame_left, top - frame_top
+            if x0 >= 0 and y0 >= 0 and y0 + height <= frame_img.shape[0] and x0 + width <= frame_img.shape[1]:
+                return np.ascontiguousarray(frame_img[y0:y0 + height, x0:x0 + width])
+
+        return self._grab(left, top, width, height)
+
+    @staticmethod
+    def _grab(left: int, top: int, width: int, height: int) -> np.ndarray:
+        """Screenshot a region and return it as a BGR numpy array."""
         screenshot = pyautogui.screenshot(region=(left, top, width, height))
         
         # Convert PIL image to numpy array for OpenCV
         img_array = np.array(screenshot)
         # Convert RGB to BGR for OpenCV
-        img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+
+    @contextmanager
+    def batch_capture(self, conditions: Iterable[Condition]) -> Iterator[None]:
+        """
+        Take one screenshot covering every condition's region and serve
+        ``capture_screen_region`` calls from it for the duration of the block.
         
-        return img_bgr
-    
+        Falls back to per-condition grabs when there is at most one region, or
+        when the union box is mostly empty space (widely separated regions),
+        where one large grab would cost more than several small ones.
+        """
+        bounds = [
+            self._region_bounds(c.position, POINT_REGION_SIZE.get(c.type, 20))
+            for c in conditions
+        ]
+        if len(bounds) > 1:
+            left = min(b[0] for b in bounds)
+            top = min(b[1] for b in bounds)
+            right = max(b[0] + b[2] for b in bounds)
+            bottom = max(b[1] + b[3] for b in bounds)
+            union_area = (right - left) * (bottom - top)
+            regions_area = sum(b[2] * b[3] for b in bounds)
+            if union_area <= 4 * regions_area or union_area <= 1_000_000:
+                try:
+                    self._frame = (left, top, self._grab(left, top, right - left, bottom - top))
+                except Exception as e:
+                    print(f"  ⚠️ Batch screen capture failed, using per-condition capture: {e}")
+        try:
+            yield
+        finally:
+            self._frame = None
+
     def detect_color(self, condition: Condition) -> bool:
         """
         Detect if a specific color is present at the given position.
@@ -93,10 +151,14 @@ class DetectionEngine:
         target_color = condition.value  # Define target_color here
         
         # Capture region (either around point or exact area)
-        img_region = self.capture_screen_region(condition.position)
+        try:
+            img_region = self.capture_screen_region(condition.position)
+        except Exception as e:
+            print(f"  ❌ Screen capture failed at {condition.position}: {e}")
+            return False
         
         # For point selection, get center pixel; for area selection, check if color exists anywhere
-        if len(condition.position) == 4:
+        if condition.kind == 'area':
             # Area selection: check if target color exists anywhere in the area
             print(f"  🔍 Scanning area {condition.position} for color RGB{target_color}")
             return self._color_exists_in_region(img_region, target_color, condition.tolerance, condition.comparator)
@@ -192,15 +254,19 @@ class DetectionEngine:
             raise ValueError("Text value must be a string")
         
         # Capture region for text detection
-        if len(condition.position) == 4:
-            # Area selection: use the exact area
-            x1, y1, x2, y2 = condition.position
-            img_region = self.capture_screen_region(condition.position)
-            print(f"  🔍 Scanning text area {condition.position} - size: {x2-x1}x{y2-y1} pixels")
-        else:
-            # Point selection: capture larger region for text detection (OCR needs more context)
-            img_region = self.capture_screen_region(condition.position, region_size=200)
-            print(f"  🔍 Scanning text around point {condition.position} - 200x200 pixel area")
+        try:
+            if condition.kind == 'area':
+                # Area selection: use the exact area
+                x1, y1, x2, y2 = condition.position
+                img_region = self.capture_screen_region(condition.position)
+                print(f"  🔍 Scanning text area {condition.position} - size: {x2-x1}x{y2-y1} pixels")
+            else:
+                # Point selection: capture larger region for text detection (OCR needs more context)
+                img_region = self.capture_screen_region(condition.position, region_size=POINT_REGION_SIZE['text'])
+                print(f"  🔍 Scanning text around point {condition.position} - 200x200 pixel area")
+        except Exception as e:
+            print(f"  ❌ Screen capture failed at {condition.position}: {e}")
+            return False
         
         target_text = condition.value.strip()
         print(f"  🎯 Target text: '{target_text}'")
@@ -398,42 +464,57 @@ class DetectionEngine:
             return False
 
     # --------------- OCR helper methods ---------------
+    def _get_buffer(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """Return a reusable uint8 buffer for ``name``, reallocating only when the shape changes."""
+        buf = self._buf.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            self._buf[name] = buf
+        return buf
+
     def _preprocess_for_ocr(self, img: np.ndarray) -> Dict[str, np.ndarray]:
-        """Generate multiple preprocessed variants to maximize OCR success."""
+        """Generate multiple preprocessed variants to maximize OCR success.
+
+        Variants are written into buffers owned by the engine, so the returned
+        arrays are only valid until the next call.
+        """
         variants: Dict[str, np.ndarray] = {}
+        shape = img.shape[:2]
 
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=self._get_buffer('gray', shape))
         variants['gray'] = gray
 
         # Adaptive threshold (handles varying backgrounds)
         adapt = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                                      cv2.THRESH_BINARY, 31, 9)
+                                      cv2.THRESH_BINARY, 31, 9, dst=self._get_buffer('adaptive', shape))
         variants['adaptive'] = adapt
 
         # OTSU (normal + inverted)
-        _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU,
+                                dst=self._get_buffer('otsu', shape))
         variants['otsu'] = otsu
-        variants['otsu_inv'] = cv2.bitwise_not(otsu)
+        variants['otsu_inv'] = cv2.bitwise_not(otsu, dst=self._get_buffer('otsu_inv', shape))
 
         # Morphological enhancement
-        kernel = np.ones((2, 2), np.uint8)
-        dilated = cv2.dilate(otsu, kernel, iterations=1)
-        eroded = cv2.erode(otsu, kernel, iterations=1)
+        kernel = self._morph_kernel
+        dilated = cv2.dilate(otsu, kernel, dst=self._get_buffer('dilated', shape), iterations=1)
+        eroded = cv2.erode(otsu, kernel, dst=self._get_buffer('eroded', shape), iterations=1)
         variants['dilated'] = dilated
         variants['eroded'] = eroded
 
         # Contrast Limited Adaptive Histogram Equalization (CLAHE)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        cl = clahe.apply(gray)
-        _, cl_bin = cv2.threshold(cl, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        cl = self._clahe.apply(gray, dst=self._get_buffer('clahe', shape))
+        _, cl_bin = cv2.threshold(cl, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU,
+                                  dst=self._get_buffer('clahe_bin', shape))
         variants['clahe'] = cl
         variants['clahe_bin'] = cl_bin
 
         # Enlarged (upsample) for small fonts
-        h, w = gray.shape[:2]
+        h, w = shape
         if max(h, w) < 200:
             scale = 2
-            enlarged = cv2.resize(gray, (w*scale, h*scale), interpolation=cv2.INTER_CUBIC)
+            enlarged = cv2.resize(gray, (w*scale, h*scale), dst=self._get_buffer('enlarged', (h*scale, w*scale)),
+                                  interpolation=cv2.INTER_CUBIC)
             variants['enlarged'] = enlarged
 
         # Enhanced variant (best guess for token parsing)
@@ -527,18 +608,16 @@ class DetectionEngine:
             condition: Condition to evaluate
             
         Returns:
-            True if condition is met, False otherwise
+            True if condition is met, False otherwise (including unknown condition types)
+            
+        Raises:
+            ValueError: If the condition value does not match its type
         """
-        try:
-            if condition.type == 'color':
-                return self.detect_color(condition)
-            elif condition.type == 'text':
-                return self.detect_text(condition)
-            else:
-                raise ValueError(f"Unknown condition type: {condition.type}")
-        except Exception as e:
-            print(f"Error evaluating condition: {e}")
+        detector = self._dispatch.get(condition.type)
+        if detector is None:
+            print(f"Error evaluating condition: Unknown condition type: {condition.type}")
             return False
+        return detector(condition)
     
     def _color_similar(self, color1: Tuple[int, int, int], color2: Tuple[int, int, int], tolerance: int) -> bool:
         """
@@ -23,13 +23,28 @@ OPTIONAL_MODULES = [
     "PIL",
 ]
 
+# Platform identity cannot change during the process lifetime
+_PLATFORM = platform.platform()
+_ARCH = platform.machine()
+
+# Import results never change within a process, so probe each module once
+_MODULE_STATUS_CACHE: Dict[str, str] = {}
+
 
 def _check_module(name: str) -> str:
-    try:
-        importlib.import_module(name)
-        return "available"
-    except Exception as e:  # pragma: no cover - best effort
-        return f"missing ({e.__class__.__name__}: {e})"
+    cached = _MODULE_STATUS_CACHE.get(name)
+    if cached is not None:
+        return cached
+    if name in sys.modules:
+        status = "available"
+    else:
+        try:
+            importlib.import_module(name)
+            status = "available"
+        except Exception as e:  # pragma: no cover - best effort
+            status = f"missing ({e.__class__.__name__}: {e})"
+    _MODULE_STATUS_CACHE[name] = status
+    return status
 
 
 def gather_startup_diagnostics() -> Dict[str, Any]:
@@ -45,15 +60,21 @@ def gather_startup_diagnostics() -> Dict[str, Any]:
     tcl_library = os.environ.get("TCL_LIBRARY")
     tk_library = os.environ.get("TK_LIBRARY")
 
+    logs_path = Path("logs")
+    try:
+        logs_path.stat()
+        has_logs_dir = True
+    except OSError:
+        has_logs_dir = False
     paths_exist = {
-        "logs_dir": str(Path("logs").resolve()),
-        "has_logs_dir": Path("logs").exists(),
+        "logs_dir": str(logs_path.resolve() if has_logs_dir else logs_path.absolute()),
+        "has_logs_dir": has_logs_dir,
     }
 
     return {
         "python_version": sys.version.replace("\n", " "),
-        "platform": platform.platform(),
-        "arch": platform.machine(),
+        "platform": _PLATFORM,
+        "arch": _ARCH,
         "frozen": frozen,
         "sys_executable": sys.executable,
         "bundle_dir": str(bundle_dir) if bundle_dir else None,
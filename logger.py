@@ -4,22 +4,359 @@ Fixes (updated):
  - Robust Windows log directory resolution with parents=True.
  - Fallback chain avoids startup crash when APPDATA points to non-existent (e.g. C:/Users/root).
  - Optional override via ADV_AUTOCLICKER_LOG_DIR environment variable.
+ - Optional main log level via ADV_AUTOCLICKER_LOG_LEVEL (default DEBUG).
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import datetime
-from typing import Optional, List
+import itertools
+from collections import deque
+import shutil
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 import threading
+import time
 import os
 import platform
+import sys
+
+# Static environment facts used to pick the log directory, resolved once at import
+_SYSTEM = platform.system()
+try:
+    _HOME: Optional[Path] = Path.home()
+except (RuntimeError, KeyError):
+    _HOME = None
+_EXE_DIR = Path(getattr(sys, "_MEIPASS", Path(sys.executable).parent))
+
+
+
+def _level_from_env(default: int = logging.DEBUG) -> int:
+    """Main log level from ADV_AUTOCLICKER_LOG_LEVEL (a name like INFO, or a number)."""
+    value = os.environ.get("ADV_AUTOCLICKER_LOG_LEVEL", "").strip()
+    if not value:
+        return default
+    if value.isdigit():
+        return int(value)
+    level = getattr(logging, value.upper(), None)
+    return level if isinstance(level, int) else default
+
+
+_STATUS_OK = "OK"
+_STATUS_FAIL = "FAIL"
+
+# Action line formats: "<status> | <action> | <details>". Arguments are merged
+# on the listener thread, so callers never build the line themselves.
+_ACTION_FMT = "%s | %s"
+_ACTION_DETAILS_FMT = "%s | %s | %s"
+_CLICK_FMT = "%s | %s | position: %s | click_type: %s"
+_DETECTION_FMT = "%s | %s | position: %s | type: %s | result: %s"
+_DETECTION_DETAILS_FMT = _DETECTION_FMT + " | %s"
+_RULE_MATCH_FMT = "%s | %s | logic: %s | conditions: %s | position: %s"
+_DETECTION_SUMMARY_FMT = "%s | %s | detected: %s | not_detected: %s | last_position: %s"
+
+
+class _ComponentFilter(logging.Filter):
+    """Render the ``component`` passed via ``extra=`` as a ``[component] `` prefix.
+
+    Runs on the listener thread, so the caller never builds the prefix.
+    Records without a component (e.g. actions) get an empty prefix.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        component = getattr(record, "component", None)
+        record.component_tag = f"[{component}] " if component else ""
+        return True
+
+
+class _Details:
+    """Render a details dict as ``key: value | ...`` only when the record is formatted.
+
+    Formatting happens later on the listener thread, so the dict is copied here,
+    on the caller's thread; changes the caller makes afterwards are not logged.
+    """
+
+    __slots__ = ("details",)
+
+    def __init__(self, details: dict):
+        self.details = dict(details)
+
+    def __str__(self) -> str:
+        return " | ".join(f"{k}: {v}" for k, v in self.details.items())
+
+
+class _SharedFormatter(logging.Formatter):
+    """Formatter shared by several handlers that formats each record only once.
+
+    An ERROR record reaches both the main and the error file (and the console
+    in development); the rendered line is cached on the record so the second
+    and third handler reuse it.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        cached = record.__dict__.get("_shared_formatted")
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        text = super().format(record)
+        record._shared_formatted = (self, text)
+        return text
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+# os.writev is POSIX-only; writes fall back to one joined os.write elsewhere
+_writev = getattr(os, "writev", None)
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX") if _writev is not None else 0
+except (ValueError, OSError, AttributeError):
+    _IOV_MAX = 0
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a bounded queue that drops records instead of blocking callers when full.
+
+    Emits without taking the handler lock: the queue is already thread-safe,
+    and the lock would serialize every logging thread (UI, monitor, heartbeat)
+    on the single shared handler.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def handle(self, record: logging.LogRecord):
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Hand the record over unformatted; only the traceback is rendered here.
+
+        The stock ``prepare`` merges ``msg % args`` on the calling thread. The
+        log_* helpers only pass values that cannot change afterwards: strings,
+        numbers, tuples, ``_Details`` (which copies its dict) and exceptions
+        already rendered with ``str()``. So merging is left to the listener's
+        formatters and the caller pays only for the enqueue.
+        """
+        if record.exc_info:
+            # Tracebacks reference live frames; render them before crossing threads
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BlockingSentinelListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for room in a full bounded queue."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class BufferedFileHandler(logging.Handler):
+    """File handler that batches writes in a userspace buffer over a raw fd.
+
+    The file is opened once with ``os.open(O_APPEND)`` and each record's UTF-8
+    bytes are queued as-is, bypassing ``TextIOWrapper``. The queued chunks are
+    written with one ``os.writev`` (a joined ``os.write`` where writev is
+    unavailable, e.g. Windows) when they exceed ``buffer_size``, immediately
+    for records at or above ``flush_level``, on close, and at interpreter
+    exit. Every ``FLUSH_INTERVAL`` seconds a single shared daemon thread
+    flushes all open instances.
+
+    Line and byte counts are kept as records are emitted so ``stats()`` can
+    report file sizes without rescanning the file; the content that existed
+    before the handler opened it is counted once, on first use.
+
+    The last ``TAIL_LINES`` lines are also kept in memory so ``tail()`` can
+    answer the log viewer without reading the file.
+    """
+
+    terminator = b'\n'
+    FLUSH_INTERVAL = 1.0
+    TAIL_LINES = 2000
+
+    _live: set = set()
+    _live_lock = threading.Lock()
+    _flusher: Optional[threading.Thread] = None
+
+    def __init__(self, path: Path, buffer_size: int = 65536, flush_level: int = logging.ERROR):
+        super().__init__()
+        self.baseFilename = str(path)
+        self._fd: Optional[int] = os.open(
+            self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644
+        )
+        self._chunks: List[bytes] = []
+        self._buffered = 0
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._recent: deque = deque(maxlen=self.TAIL_LINES)
+        self._reset_counters()
+        with BufferedFileHandler._live_lock:
+            BufferedFileHandler._live.add(self)
+            if BufferedFileHandler._flusher is None:
+                BufferedFileHandler._flusher = threading.Thread(
+                    target=BufferedFileHandler._flush_loop, name="log-flush", daemon=True
+                )
+                BufferedFileHandler._flusher.start()
+                atexit.register(BufferedFileHandler._flush_all)
+
+    def _reset_counters(self):
+        st = os.fstat(self._fd)
+        self._base_bytes = st.st_size
+        self._base_lines: Optional[int] = None if st.st_size else 0
+        self.lines_written = 0
+        self.bytes_written = 0
+        self.last_write = st.st_mtime
+        self._recent.clear()
+        # The in-memory tail mirrors the whole file until older content exists or lines fall off
+        self._recent_complete = st.st_size == 0
+
+    @classmethod
+    def _flush_all(cls):
+        with cls._live_lock:
+            handlers = list(cls._live)
+        for handler in handlers:
+            handler.flush()
+
+    @classmethod
+    def _flush_loop(cls):
+        while True:
+            time.sleep(cls.FLUSH_INTERVAL)
+            cls._flush_all()
+
+    def _write_all(self, data: bytes):
+        with memoryview(data) as view:
+            offset = 0
+            while offset < len(view):
+                offset += os.write(self._fd, view[offset:])
+
+    def _write_buffer(self):
+        # Caller holds the handler lock
+        chunks = self._chunks
+        if _writev is None:
+            self._write_all(b''.join(chunks))
+        else:
+            for start in range(0, len(chunks), _IOV_MAX):
+                batch = chunks[start:start + _IOV_MAX]
+                written = _writev(self._fd, batch)
+                if written < sum(map(len, batch)):
+                    # Short write: finish the rest of this batch with plain writes
+                    self._write_all(b''.join(batch)[written:])
+        self._chunks = []
+        self._buffered = 0
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            text = self.format(record)
+            lines = text.splitlines()
+            if self._recent_complete and len(self._recent) + len(lines) > self.TAIL_LINES:
+                self._recent_complete = False
+            self._recent.extend(lines)
+            data = text.encode('utf-8')
+            self._chunks.append(data)
+            self._chunks.append(self.terminator)
+            self._buffered += len(data) + 1
+            self.lines_written += data.count(b'\n') + 1
+            self.bytes_written += len(data) + 1
+            self.last_write = record.created
+            if record.levelno >= self.flush_level or self._buffered >= self.buffer_size:
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._fd is not None and self._chunks:
+                self._write_buffer()
+        finally:
+            self.release()
+
+    def stats(self) -> Tuple[int, int, float]:
+        """Return ``(lines, size_bytes, mtime)`` for the file, including buffered records."""
+        if self._base_lines is None:
+            base_lines = 0
+            remaining = self._base_bytes
+            with open(self.baseFilename, 'rb') as f:
+                while remaining > 0 and (chunk := f.read(min(remaining, 1 << 20))):
+                    base_lines += chunk.count(b'\n')
+                    remaining -= len(chunk)
+            self._base_lines = base_lines
+        self.acquire()
+        try:
+            return (self._base_lines + self.lines_written,
+                    self._base_bytes + self.bytes_written,
+                    self.last_write)
+        finally:
+            self.release()
+
+    def tail(self, lines: int) -> Optional[List[str]]:
+        """Return the last ``lines`` lines from memory, or None if the file must be read."""
+        self.acquire()
+        try:
+            if lines <= len(self._recent):
+                return list(itertools.islice(self._recent, len(self._recent) - lines, None))
+            if self._recent_complete:
+                return list(self._recent)
+            return None
+        finally:
+            self.release()
+
+    def reopen(self):
+        """Reopen the file at its path, e.g. after it was deleted, and reset the counters."""
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+            self._chunks = []
+            self._buffered = 0
+            self._fd = os.open(
+                self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644
+            )
+            self._reset_counters()
+        finally:
+            self.release()
+
+    def close(self):
+        with BufferedFileHandler._live_lock:
+            BufferedFileHandler._live.discard(self)
+        self.acquire()
+        try:
+            if self._fd is not None:
+                try:
+                    if self._chunks:
+                        self._write_buffer()
+                finally:
+                    os.close(self._fd)
+                    self._fd = None
+        finally:
+            self.release()
+            super().close()
 
 
 class AutoclickerLogger:
     """Centralized logging system for the autoclicker application."""
 
+    DETECTION_SUMMARY_INTERVAL = 1.0  # seconds between coalesced detection summaries
+    QUEUE_MAXSIZE = 10000  # records buffered for the listener thread before dropping
+    PENDING_MAXLEN = 1000  # debug records kept before the first real record; oldest dropped
+    HEARTBEAT_INTERVAL = 300.0  # seconds; skipped when nothing was logged in between
+
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = self._determine_log_dir(log_dir)
 
@@ -28,12 +365,45 @@ class AutoclickerLogger:
         self.error_log_file = self.log_dir / "errors.log"
         self.action_log_file = self.log_dir / "actions.log"
 
-        self.lock = threading.Lock()
-        self._last_detection_success: Optional[bool] = None
-        self._suppressed_not_detected: int = 0
-
-        self._setup_loggers()
-        self.log_info("=== Autoclicker Session Started ===")
+        # Repeated detection results are coalesced into one summary per window, per
+        # condition: (position, condition_type) -> [last result, detected, not detected].
+        # itertools.count increments atomically in C; read-and-reset swaps in a fresh counter
+        self._detection_states: Dict[tuple, list] = {}
+        self._detection_window_start: float = time.monotonic()
+        self._stop_event = threading.Event()
+
+        # Handlers, the listener thread and the heartbeat start on the first
+        # record above DEBUG; earlier debug records wait in _pending as
+        # (created, message, component), guarded by _init_lock.
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._closed = False
+        self._pending: deque = deque(maxlen=self.PENDING_MAXLEN)
+        # Read once; release builds set INFO so debug calls stop at the fast path
+        self.log_level = _level_from_env()
+        # Level fast paths; refined by _refresh_levels() once loggers exist
+        self._debug_enabled = self.log_level <= logging.DEBUG
+        self._action_enabled = True
+
+    def _ensure_initialized(self):
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._setup_loggers()
+            self.main_logger.info("=== Autoclicker Session Started ===", extra={"component": "general"})
+            if self._debug_enabled:
+                for created, message, component in self._pending:
+                    # Replay with the time the call was made, not the init time
+                    record = self.main_logger.makeRecord(
+                        self.main_logger.name, logging.DEBUG, "(pending)", 0, message, None, None,
+                        extra={"component": component})
+                    record.created = created
+                    record.msecs = (created - int(created)) * 1000
+                    self.main_logger.handle(record)
+            self._pending.clear()
+            self._initialized = True
         self._start_heartbeat()
 
     # ---------- log directory resolution ----------
@@ -46,10 +416,10 @@ class AutoclickerLogger:
         if log_dir_param != "logs":
             candidates.append(Path(log_dir_param).expanduser())
         else:
-            system = platform.system()
-            if system == "Darwin":
-                candidates.append(Path.home() / "Library" / "Logs" / "AdvancedAutoclicker")
-            elif system == "Windows":
+            if _SYSTEM == "Darwin":
+                if _HOME is not None:
+                    candidates.append(_HOME / "Library" / "Logs" / "AdvancedAutoclicker")
+            elif _SYSTEM == "Windows":
                 for var in ("APPDATA", "LOCALAPPDATA", "USERPROFILE"):
                     base = os.environ.get(var)
                     if base:
@@ -57,12 +427,10 @@ class AutoclickerLogger:
                         if "root" in [part.lower() for part in p.parts] and not p.parent.exists():
                             continue
                         candidates.append(p)
-            else:
-                candidates.append(Path.home() / ".advanced_autoclicker" / "logs")
+            elif _HOME is not None:
+                candidates.append(_HOME / ".advanced_autoclicker" / "logs")
 
-        import sys
-        exe_dir = Path(getattr(sys, "_MEIPASS", Path(sys.executable).parent))
-        candidates.append(exe_dir / "logs")
+        candidates.append(_EXE_DIR / "logs")
         candidates.append(Path.cwd() / "logs")
         candidates.append(Path.cwd())
 
@@ -75,117 +443,223 @@ class AutoclickerLogger:
         return Path.cwd()
 
     def _start_heartbeat(self):
+        main_handler = self._file_handlers[str(self.main_log_file)]
+
         def beat():  # pragma: no cover
-            import time
-            while True:
+            last_seen = main_handler.lines_written
+            while not self._stop_event.wait(self.HEARTBEAT_INTERVAL):
+                # An idle session writes nothing, so don't wake the log path just to say so
+                if not self._debug_enabled or main_handler.lines_written == last_seen:
+                    continue
+                last_seen = main_handler.lines_written + 1  # count the heartbeat line itself
                 try:
                     self.log_debug("heartbeat", "hb")
                 except Exception:
                     pass
-                time.sleep(30)
         t = threading.Thread(target=beat, name="log-heartbeat", daemon=True)
         t.start()
 
     def _setup_loggers(self):
+        """Route all named loggers through one QueueHandler and do file/console I/O on a listener thread.
+
+        main/errors/actions are children of the ``autoclicker`` logger and
+        propagate to it, so each record is enqueued exactly once. The
+        QueueListener fans records out to the real handlers, which route by
+        logger name via filters:
+          autoclicker.log <- main, errors, actions
+          errors.log      <- errors
+          actions.log     <- actions
+          console         <- main (interactive terminals only)
+        """
+        self.root_logger = logging.getLogger('autoclicker')
+        self.root_logger.setLevel(logging.DEBUG)
+        self.root_logger.propagate = False
         self.main_logger = logging.getLogger('autoclicker.main')
-        self.main_logger.setLevel(logging.DEBUG)
+        self.main_logger.setLevel(self.log_level)
         self.error_logger = logging.getLogger('autoclicker.errors')
         self.error_logger.setLevel(logging.ERROR)
         self.action_logger = logging.getLogger('autoclicker.actions')
         self.action_logger.setLevel(logging.INFO)
 
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+        detailed_formatter = _SharedFormatter(
+            '%(asctime)s | %(levelname)-8s | %(name)s | %(component_tag)s%(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         simple_formatter = logging.Formatter('%(asctime)s | %(message)s', datefmt='%H:%M:%S')
+        component_filter = _ComponentFilter()
 
-        main_handler = logging.FileHandler(self.main_log_file, encoding='utf-8')
+        main_handler = BufferedFileHandler(self.main_log_file)
         main_handler.setFormatter(detailed_formatter)
+        main_handler.addFilter(component_filter)
         main_handler.setLevel(logging.DEBUG)
 
-        error_handler = logging.FileHandler(self.error_log_file, encoding='utf-8')
+        error_handler = BufferedFileHandler(self.error_log_file)
         error_handler.setFormatter(detailed_formatter)
+        error_handler.addFilter(component_filter)
         error_handler.setLevel(logging.ERROR)
+        error_handler.addFilter(logging.Filter(self.error_logger.name))
 
-        action_handler = logging.FileHandler(self.action_log_file, encoding='utf-8')
+        action_handler = BufferedFileHandler(self.action_log_file)
         action_handler.setFormatter(simple_formatter)
         action_handler.setLevel(logging.INFO)
-
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(detailed_formatter)
-        console_handler.setLevel(logging.INFO)
-
-        self.main_logger.addHandler(main_handler)
-        self.main_logger.addHandler(console_handler)
-        self.error_logger.addHandler(error_handler)
-        self.error_logger.addHandler(main_handler)
-        self.action_logger.addHandler(action_handler)
-        self.action_logger.addHandler(main_handler)
-
-        self.main_logger.propagate = False
-        self.error_logger.propagate = False
-        self.action_logger.propagate = False
+        action_handler.addFilter(logging.Filter(self.action_logger.name))
+
+        self._handlers = [main_handler, error_handler, action_handler]
+        self._file_handlers = {h.baseFilename: h for h in (main_handler, error_handler, action_handler)}
+
+        # Packaged apps have no readable stderr; skip the console path entirely there
+        want_console = (not getattr(sys, "frozen", False)) and sys.stderr is not None and sys.stderr.isatty()
+        if want_console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(detailed_formatter)
+            console_handler.addFilter(component_filter)
+            console_handler.setLevel(logging.INFO)
+            console_handler.addFilter(logging.Filter(self.main_logger.name))
+            self._handlers.append(console_handler)
+
+        # Bounded so a stalled disk cannot grow memory without limit; overflow is dropped
+        log_queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_MAXSIZE)
+        self._queue_handler = _DroppingQueueHandler(log_queue)
+        self._listener = _BlockingSentinelListener(log_queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+        # Drain the queue at interpreter exit. Registered after the handlers' own
+        # atexit flush, so it runs first and the flush sees every queued record.
+        atexit.register(self.close)
+
+        self.root_logger.addHandler(self._queue_handler)
+        for logger in (self.main_logger, self.error_logger, self.action_logger):
+            logger.propagate = True
+
+        self._refresh_levels()
+
+    def _refresh_levels(self):
+        """Cache level checks used as fast paths by the log_* helpers."""
+        self._debug_enabled = self.main_logger.isEnabledFor(logging.DEBUG)
+        self._action_enabled = self.action_logger.isEnabledFor(logging.INFO)
+
+    @property
+    def debug_enabled(self) -> bool:
+        """True when debug messages are recorded; guard costly log_debug arguments with it."""
+        return self._debug_enabled
 
     def log_debug(self, message: str, component: str = "general"):
-        with self.lock:
-            self.main_logger.debug(f"[{component}] {message}")
+        if not self._debug_enabled:
+            return
+        if not self._initialized:
+            created = time.time()
+            with self._init_lock:
+                # Re-check: initialization may have finished while waiting for the lock
+                if not self._initialized:
+                    self._pending.append((created, message, component))
+                    return
+        self.main_logger.debug(message, extra={"component": component})
 
     def log_info(self, message: str, component: str = "general"):
-        with self.lock:
-            self.main_logger.info(f"[{component}] {message}")
+        self._ensure_initialized()
+        self.main_logger.info(message, extra={"component": component})
 
     def log_warning(self, message: str, component: str = "general"):
-        with self.lock:
-            self.main_logger.warning(f"[{component}] {message}")
+        self._ensure_initialized()
+        self.main_logger.warning(message, extra={"component": component})
 
     def log_error(self, message: str, component: str = "general", exception: Optional[Exception] = None):
-        with self.lock:
-            error_msg = f"[{component}] {message}"
-            if exception:
-                error_msg += f" | Exception: {exception}"
-            self.error_logger.error(error_msg)
-            if exception:
-                import traceback
-                self.error_logger.error(f"[{component}] Traceback: {traceback.format_exc()}")
+        self._ensure_initialized()
+        if exception is None:
+            self.error_logger.error(message, extra={"component": component})
+        else:
+            # exc_info lets logging format the traceback once, only if the record is emitted
+            self.error_logger.error("%s | Exception: %s", message, str(exception),
+                                   exc_info=exception, extra={"component": component})
 
     def log_action(self, action: str, details: dict = None, success: bool = True):
-        with self.lock:
-            status = "✅ SUCCESS" if success else "❌ FAILED"
-            message = f"{status} | {action}"
-            if details:
-                detail_str = " | ".join([f"{k}: {v}" for k, v in details.items()])
-                message += f" | {detail_str}"
-            self.action_logger.info(message)
+        self._ensure_initialized()
+        if not self._action_enabled:
+            return
+        if details:
+            self._emit_action(success, _ACTION_DETAILS_FMT, action, _Details(details))
+        else:
+            self._emit_action(success, _ACTION_FMT, action)
+
+    def _emit_action(self, success: bool, fmt: str, action: str, *args):
+        """Write one action record; callers have already run _ensure_initialized and the level check."""
+        self.action_logger.info(fmt, _STATUS_OK if success else _STATUS_FAIL, action, *args)
 
     def log_detection(self, position: tuple, condition_type: str, result: bool, details: dict = None):
+        """Log a detection result, coalescing repeats of each condition's current state.
+
+        State is tracked per (position, condition_type), so a rule whose
+        conditions disagree does not look like one flapping result. A state
+        change (first result, or DETECTED <-> NOT_DETECTED) for a condition is
+        logged in full. Repeats of the same state only bump that condition's
+        counter and are written as DETECTION_SUMMARY lines once per
+        DETECTION_SUMMARY_INTERVAL. Lock-free under the GIL: a race can at
+        worst miscount a single event.
+        """
+        self._ensure_initialized()
+        if not self._action_enabled:
+            return
+        result = bool(result)
+        now = time.monotonic()
+        key = (position, condition_type)
+        state = self._detection_states.get(key)
+        if state is not None and state[0] == result:
+            next(state[1] if result else state[2])
+            if now - self._detection_window_start >= self.DETECTION_SUMMARY_INTERVAL:
+                self._flush_detection_summary(now)
+            return
+        if state is None:
+            self._detection_states[key] = [result, itertools.count(), itertools.count()]
+        else:
+            # Report the repeats of the old state before the change itself
+            self._emit_detection_summary(position, state)
+            state[0] = result
         status = "DETECTED" if result else "NOT_DETECTED"
-        with self.lock:
-            if not result and self._last_detection_success is False:
-                self._suppressed_not_detected += 1
-                return
-            action_details = {"position": position, "type": condition_type, "result": status}
-            if details:
-                action_details.update(details)
-            if result and self._suppressed_not_detected:
-                self.main_logger.debug(f"[detection] Suppressed {self._suppressed_not_detected} repeated NOT_DETECTED events")
-                self._suppressed_not_detected = 0
-            self._last_detection_success = result
-        self.log_action("DETECTION", action_details, success=result)
+        if details:
+            self._emit_action(result, _DETECTION_DETAILS_FMT, "DETECTION",
+                              position, condition_type, status, _Details(details))
+        else:
+            self._emit_action(result, _DETECTION_FMT, "DETECTION", position, condition_type, status)
+
+    def _flush_detection_summary(self, now: float):
+        self._detection_window_start = now
+        for (position, _condition_type), state in list(self._detection_states.items()):
+            self._emit_detection_summary(position, state)
+
+    def _emit_detection_summary(self, position: tuple, state: list):
+        detected_counter, state[1] = state[1], itertools.count()
+        not_detected_counter, state[2] = state[2], itertools.count()
+        # next() on a count() returns how many times it was advanced before
+        detected, not_detected = next(detected_counter), next(not_detected_counter)
+        if not (detected or not_detected):
+            return
+        self._emit_action(
+            state[0], _DETECTION_SUMMARY_FMT, "DETECTION_SUMMARY",
+            detected, not_detected, position,
+        )
 
     def log_click(self, position: tuple, click_type: str = "single", success: bool = True):
-        self.log_action("MOUSE_CLICK", {"position": position, "click_type": click_type}, success=success)
+        self._ensure_initialized()
+        if not self._action_enabled:
+            return
+        self._emit_action(success, _CLICK_FMT, "MOUSE_CLICK", position, click_type)
 
     def log_monitoring(self, action: str, rule_count: int = 0, success: bool = True):
+        if not self._action_enabled:
+            return
         details = {"action": action}
         if rule_count > 0:
             details["rules"] = rule_count
         self.log_action("MONITORING", details, success=success)
 
     def log_rule_match(self, rule_logic: str, condition_count: int, position: tuple):
-        self.log_action("RULE_MATCHED", {"logic": rule_logic, "conditions": condition_count, "position": position}, success=True)
+        self._ensure_initialized()
+        if not self._action_enabled:
+            return
+        self._emit_action(True, _RULE_MATCH_FMT, "RULE_MATCHED", rule_logic, condition_count, position)
 
     def log_delay_popup(self, action: str, delay_seconds: int = 0, popup_enabled: bool = False):
+        if not self._action_enabled:
+            return
         details = {"action": action}
         if delay_seconds > 0:
             details["delay"] = f"{delay_seconds}s"
@@ -193,19 +667,65 @@ class AutoclickerLogger:
             details["popup"] = "enabled"
         self.log_action("DELAY_POPUP", details, success=True)
 
+    def flush(self):
+        """Push buffered file output to disk so readers see every emitted record."""
+        if not self._initialized:
+            return
+        for handler in self._handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
     def get_recent_logs(self, log_type: str = "main", lines: int = 100) -> List[str]:
         log_file_map = {"main": self.main_log_file, "error": self.error_log_file, "action": self.action_log_file}
         log_file = log_file_map.get(log_type, self.main_log_file)
+        if lines <= 0:
+            return []
+        handler = self._file_handlers.get(str(log_file)) if self._initialized else None
+        if handler is not None:
+            recent = handler.tail(lines)
+            if recent is not None:
+                return [line.strip() for line in recent]
+            handler.flush()
         try:
             if not log_file.exists():
                 return []
-            with open(log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-            return [line.strip() for line in all_lines[-lines:]]
+            return [line.strip() for line in self._tail_lines(log_file, lines)]
         except Exception as e:
             self.log_error(f"Failed to read log file {log_file}", "logger", e)
             return [f"Error reading log file: {e}"]
 
+    @staticmethod
+    def _tail_lines(log_file: Path, lines: int) -> List[str]:
+        """Return the last ``lines`` lines by reading backwards in growing chunks (like ``tail -n``)."""
+        if lines <= 0:
+            return []
+        size = log_file.stat().st_size
+        # Start from a typical line length so most calls need a single read
+        chunk = max(4096, lines * 128)
+        blocks: List[bytes] = []
+        newlines = 0
+        end = size
+        with open(log_file, 'rb') as f:
+            while end > 0:
+                start = max(0, end - chunk)
+                f.seek(start)
+                block = f.read(end - start)
+                blocks.append(block)
+                newlines += block.count(b'\n')
+                end = start
+                # One extra newline guarantees the first kept line is complete
+                if newlines > lines:
+                    break
+                chunk *= 2
+        start = end
+        data = b''.join(reversed(blocks))
+        tail_lines = data.decode('utf-8', errors='replace').splitlines()
+        if start > 0:
+            tail_lines = tail_lines[1:]
+        return tail_lines[-lines:]
+
     def get_logs_by_type(self, log_type: str, lines: int = 500) -> List[str]:
         return self.get_recent_logs(log_type, lines)
 
@@ -218,26 +738,37 @@ class AutoclickerLogger:
     def get_log_stats(self) -> dict:
         stats = {}
         log_files = {"main": self.main_log_file, "error": self.error_log_file, "action": self.action_log_file}
+        # Open handlers keep running counts; files are only scanned when logging never started
+        file_handlers = self._file_handlers if self._initialized else {}
         for log_type, log_file in log_files.items():
             try:
-                if log_file.exists():
+                handler = file_handlers.get(str(log_file))
+                if handler is not None:
+                    line_count, size, mtime = handler.stats()
+                elif log_file.exists():
                     stat = log_file.stat()
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        line_count = sum(1 for _ in f)
-                    stats[log_type] = {
-                        "file": str(log_file),
-                        "size": stat.st_size,
-                        "size_mb": round(stat.st_size / 1024 / 1024, 2),
-                        "lines": line_count,
-                        "modified": datetime.datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    }
+                    size, mtime = stat.st_size, stat.st_mtime
+                    line_count = 0
+                    with open(log_file, 'rb') as f:
+                        while chunk := f.read(1 << 20):
+                            line_count += chunk.count(b'\n')
                 else:
                     stats[log_type] = {"file": str(log_file), "exists": False}
+                    continue
+                stats[log_type] = {
+                    "file": str(log_file),
+                    "size": size,
+                    "size_mb": round(size / 1024 / 1024, 2),
+                    "lines": line_count,
+                    "modified": datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
+                }
             except Exception as e:
                 stats[log_type] = {"error": str(e)}
         return stats
 
     def clear_logs(self, log_type: str = "all"):
+        self._ensure_initialized()
+        self._refresh_levels()
         if log_type == "all":
             targets = [self.main_log_file, self.error_log_file, self.action_log_file]
         elif log_type == "main":
@@ -252,11 +783,16 @@ class AutoclickerLogger:
             try:
                 if lf.exists():
                     lf.unlink()
+                    # Start a fresh file (and fresh counters) instead of writing into the unlinked one
+                    handler = self._file_handlers.get(str(lf))
+                    if handler is not None:
+                        handler.reopen()
                     self.log_info(f"Cleared log file: {lf.name}", "logger")
             except Exception as e:
                 self.log_error(f"Failed to clear log file {lf.name}", "logger", e)
 
     def export_logs(self, export_path: str, log_type: str = "all") -> bool:
+        self.flush()
         try:
             export_dir = Path(export_path)
             export_dir.mkdir(exist_ok=True)
@@ -274,8 +810,10 @@ class AutoclickerLogger:
                     return False
                 mapping = [(src, f"autoclicker_{log_type}_{ts}.log")]
             for src, name in mapping:
-                if src.exists():
-                    (export_dir / name).write_text(src.read_text(encoding='utf-8'), encoding='utf-8')
+                try:
+                    shutil.copyfile(src, export_dir / name)
+                except FileNotFoundError:
+                    continue
             self.log_info(f"Exported logs to {export_path}", "logger")
             return True
         except Exception as e:
@@ -283,13 +821,26 @@ class AutoclickerLogger:
             return False
 
     def close(self):
+        self._stop_event.set()
+        if not self._initialized or self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._flush_detection_summary(time.monotonic())
+        if self._queue_handler.dropped:
+            self.log_warning(f"Dropped {self._queue_handler.dropped} log records (queue full)", "logger")
         self.log_info("=== Autoclicker Session Ended ===")
-        for logger in [self.main_logger, self.error_logger, self.action_logger]:
-            for handler in list(logger.handlers):
-                try:
-                    handler.close()
-                except Exception:
-                    pass
+        self.root_logger.removeHandler(self._queue_handler)
+        # Stopping the listener drains any queued records before the handlers close
+        try:
+            self._listener.stop()
+        except Exception:
+            pass
+        for handler in self._handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
 
 
 _logger_instance: Optional[AutoclickerLogger] = None
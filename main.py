@@ -4,7 +4,7 @@ Autoclicker main entry point with AC-3 delay/popup functionality
 """
 import sys
 from ui import AutoclickerUI
-from permission_preflight import run_permission_preflight
+from permission_preflight import start_permission_preflight
 
 
 def main():
@@ -12,7 +12,7 @@ def main():
     try:
         print("Starting Autoclicker with AC-3 Delay/Popup functionality...")
         # Trigger macOS permission prompts early (no-op on other platforms)
-        run_permission_preflight()
+        start_permission_preflight()
         app = AutoclickerUI()
         app.run()
     except KeyboardInterrupt:
@@ -6,7 +6,7 @@ surface errors in logs and optionally a message box.
 
 from new_ui import ModernAutoclickerUI
 from logger import get_logger
-from permission_preflight import run_permission_preflight
+from permission_preflight import start_permission_preflight
 import traceback
 import os
 import sys
@@ -19,8 +19,8 @@ def main():
     logger.log_info(f"Working Dir: {os.getcwd()}", "startup")
     logger.log_info(f"Frozen: {getattr(sys, 'frozen', False)}", "startup")
     try:
-        # Trigger macOS permission prompts early (no-op on other platforms)
-        run_permission_preflight(logger)
+        # Trigger macOS permission prompts early without blocking the UI (no-op on other platforms)
+        start_permission_preflight(logger)
         app = ModernAutoclickerUI()
         app.run()
     except Exception as e:  # capture and log any startup crash
@@ -2,14 +2,48 @@
 Screen monitoring system for autoclicker - coordinates detection and rule evaluation.
 """
 
-import time
+import itertools
+import os
 import threading
-from typing import List, Callable, Optional
-from config import Rule, Config
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from config import Condition, ConditionGroup, Rule, Config
 from detection import DetectionEngine
 from logger import get_logger
 
 
+class CompiledRule(NamedTuple):
+    """Per-rule data resolved once when monitoring starts, not on every tick."""
+    rule: Rule
+    groups: Tuple[ConditionGroup, ...]
+    conditions: Tuple[Condition, ...]  # standalone conditions
+    logic: str  # lower-cased logic between groups/standalone results
+    n: Optional[int]
+    all_conditions: Tuple[Condition, ...]
+
+
+def compile_rule(rule: Rule) -> CompiledRule:
+    """Resolve a rule's optional attributes and flatten its conditions.
+
+    Groups are copied with a tuple of their members, so the monitor thread never
+    iterates a list the UI thread may be editing.
+    """
+    groups = tuple(ConditionGroup(tuple(g.conditions), g.logic, g.n, g.name)
+                   for g in rule.condition_groups or ())
+    conditions = tuple(rule.conditions or ())
+    logic = (getattr(rule, 'group_logic', None) or 'any').lower()
+    all_conditions = tuple(c for g in groups for c in g.conditions) + conditions
+    return CompiledRule(rule, groups, conditions, logic, getattr(rule, 'n', None), all_conditions)
+
+
+def detection_details(condition: Condition) -> dict:
+    """Static per-condition details attached to logged detection results."""
+    return {
+        "value": str(condition.value),
+        "comparator": condition.comparator,
+        "tolerance": condition.tolerance
+    }
+
+
 class ScreenMonitor:
     """Monitors screen positions and evaluates rules for autoclicker automation"""
     
@@ -24,11 +58,32 @@ class ScreenMonitor:
         self.detection_engine = DetectionEngine()
         self.logger = get_logger()
         self.is_monitoring = False
-        self.is_processing_match = False  # Flag to pause monitoring during user intervention
+        # Set by stop_monitoring() to wake the loop out of its interval wait
+        self._stop_event = threading.Event()
+        # Cleared while a match is being processed (delay/popup); the loop blocks on it
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         self.monitor_thread: Optional[threading.Thread] = None
         self.on_rule_matched: Optional[Callable] = None
+        self._compiled_rules: List[CompiledRule] = []
+        # Detection log details per condition (keyed by id), built with the compiled rules
+        self._detection_details: Dict[int, dict] = {}
         self.monitor_interval = 0.5  # Check every 500ms
+        # Per-tick trace output (routed to the debug log); off unless ADV_MONITOR_DEBUG=1
+        self.debug = os.environ.get('ADV_MONITOR_DEBUG', '0') == '1'
         
+    @property
+    def is_processing_match(self) -> bool:
+        """True while monitoring is paused for user intervention."""
+        return not self._resume_event.is_set()
+
+    @is_processing_match.setter
+    def is_processing_match(self, value: bool) -> None:
+        if value:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+
     def set_rule_matched_callback(self, callback: Callable) -> None:
         """
         Set callback function to be called when a rule is matched.
@@ -46,18 +101,26 @@ class ScreenMonitor:
             True if monitoring started successfully, False otherwise
         """
         if self.is_monitoring:
-            print("Monitoring is already running")
+            self.logger.log_warning("Monitoring is already running", "monitor")
             return False
             
         if not self.config.rules:
-            print("No rules configured for monitoring")
+            self.logger.log_warning("No rules configured for monitoring", "monitor")
             return False
             
+        self._compiled_rules = [compile_rule(rule) for rule in self.config.rules]
+        self._detection_details = {
+            id(condition): detection_details(condition)
+            for compiled in self._compiled_rules
+            for condition in compiled.all_conditions
+        }
+        self._stop_event.clear()
+        self._resume_event.set()
         self.is_monitoring = True
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         
-        print(f"Started monitoring {len(self.config.rules)} rule(s)")
+        self.logger.log_info(f"Started monitoring {len(self.config.rules)} rule(s)", "monitor")
         return True
         
     def stop_monitoring(self) -> bool:
@@ -68,16 +131,18 @@ class ScreenMonitor:
             True if monitoring stopped successfully, False otherwise
         """
         if not self.is_monitoring:
-            print("Monitoring is not running")
+            self.logger.log_warning("Monitoring is not running", "monitor")
             return False
             
         self.is_monitoring = False
+        self._stop_event.set()
+        self._resume_event.set()  # wake the loop if it is paused on a match
         
         # Wait for monitor thread to finish
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=1.0)
             
-        print("Monitoring stopped")
+        self.logger.log_info("Monitoring stopped", "monitor")
         return True
         
     def is_running(self) -> bool:
@@ -94,99 +159,102 @@ class ScreenMonitor:
         Evaluate a rule by checking both condition groups and standalone conditions.
         Applies the main logic across group results and standalone conditions.
         """
-        group_results = []
-        if hasattr(rule, 'condition_groups') and rule.condition_groups:
-            print(f"Evaluating rule with {len(rule.condition_groups)} condition groups")
-            for group_idx, group in enumerate(rule.condition_groups):
-                print(f"Evaluating group {group_idx+1}: {group.name} with {len(group.conditions)} conditions")
-                condition_results = []
-                for condition in group.conditions:
-                    try:
-                        result = self.detection_engine.evaluate_condition(condition)
-                        condition_results.append(result)
-                        self.logger.log_detection(
-                            position=condition.position,
-                            condition_type=condition.type,
-                            result=result,
-                            details={
-                                "value": str(condition.value),
-                                "comparator": condition.comparator,
-                                "tolerance": condition.tolerance
-                            }
-                        )
-                        print(f"Group {group_idx+1} - Condition {condition.type}:{condition.value} at {condition.position} = {result}")
-                    except Exception as e:
-                        self.logger.log_error(f"Error evaluating condition {condition.type} at {condition.position}", "monitor", e)
-                        print(f"Error evaluating condition: {e}")
-                        condition_results.append(False)
-                group_result = self._apply_rule_logic(group.logic, condition_results, group.n)
-                group_results.append(group_result)
-                print(f"Group {group_idx+1} ({group.name}) with logic '{group.logic}' result: {group_result}")
+        return self._evaluate_compiled(compile_rule(rule))
 
-        # Evaluate standalone conditions (not in any group)
-        standalone_results = []
-        if hasattr(rule, 'conditions') and rule.conditions:
-            print(f"Evaluating {len(rule.conditions)} standalone conditions")
-            for condition in rule.conditions:
-                try:
-                    result = self.detection_engine.evaluate_condition(condition)
-                    standalone_results.append(result)
-                    self.logger.log_detection(
-                        position=condition.position,
-                        condition_type=condition.type,
-                        result=result,
-                        details={
-                            "value": str(condition.value),
-                            "comparator": condition.comparator,
-                            "tolerance": condition.tolerance
-                        }
-                    )
-                    print(f"Standalone condition {condition.type}:{condition.value} at {condition.position} = {result}")
-                except Exception as e:
-                    self.logger.log_error(f"Error evaluating standalone condition {condition.type} at {condition.position}", "monitor", e)
-                    print(f"Error evaluating standalone condition: {e}")
-                    standalone_results.append(False)
+    def _evaluate_compiled(self, compiled: CompiledRule) -> bool:
+        """
+        Evaluate a precompiled rule.
+        
+        All condition regions of the rule are served from a single screenshot
+        taken up front, instead of one screen grab per condition.
+        """
+        with self.detection_engine.batch_capture(compiled.all_conditions):
+            return self._evaluate_rule_conditions(compiled)
 
-        # Combine group results and standalone condition results
-        all_results = group_results + standalone_results
-        print(f"Combining {len(group_results)} group results and {len(standalone_results)} standalone results")
+    def _evaluate_rule_conditions(self, compiled: CompiledRule) -> bool:
+        """
+        Evaluate groups and standalone conditions of a rule and combine the results.
+        
+        Results are produced lazily, so 'any'/'all' logic stops running detections
+        as soon as the outcome is decided.
+        """
+        if not compiled.groups and not compiled.conditions:
+            if self.debug:
+                self.logger.log_debug("No group or standalone results to evaluate", "monitor")
+            return False
 
-        # Determine which logic to use
-        main_logic = getattr(rule, 'group_logic', 'any')
-        n = getattr(rule, 'n', None)
-        if main_logic is None:
-            main_logic = 'any'
+        if self.debug:
+            self.logger.log_debug(f"Evaluating rule with {len(compiled.groups)} condition groups and {len(compiled.conditions)} standalone conditions", "monitor")
 
-        # If there are no results, rule is not satisfied
-        if not all_results:
-            print("No group or standalone results to evaluate")
-            return False
+        all_results = itertools.chain(
+            self._iter_group_results(compiled.groups),
+            self._iter_condition_results(compiled.conditions, "Standalone condition"),
+        )
 
         # Apply main logic across all results
-        final_result = self._apply_rule_logic(main_logic, all_results, n)
-        print(f"Final rule result with '{main_logic.upper()}' logic across {len(all_results)} items: {final_result}")
+        final_result = self._apply_rule_logic(compiled.logic, all_results, compiled.n)
+        if self.debug:
+            self.logger.log_debug(f"Final rule result with '{compiled.logic.upper()}' logic: {final_result}", "monitor")
         return final_result
+
+    def _iter_group_results(self, groups: Tuple[ConditionGroup, ...]) -> Iterator[bool]:
+        """Yield each group's result, evaluating a group only when it is consumed."""
+        for group_idx, group in enumerate(groups):
+            if not group.conditions:
+                if self.debug:
+                    self.logger.log_debug(f"No condition results to evaluate for {group.logic} logic", "monitor")
+                yield False
+                continue
+            if self.debug:
+                self.logger.log_debug(f"Evaluating group {group_idx+1}: {group.name} with {len(group.conditions)} conditions", "monitor")
+            condition_results = self._iter_condition_results(group.conditions, f"Group {group_idx+1} - Condition")
+            group_result = self._apply_rule_logic(group.logic, condition_results, group.n)
+            if self.debug:
+                self.logger.log_debug(f"Group {group_idx+1} ({group.name}) with logic '{group.logic}' result: {group_result}", "monitor")
+            yield group_result
+
+    def _iter_condition_results(self, conditions: Tuple[Condition, ...], label: str) -> Iterator[bool]:
+        """Yield each condition's result, running its detection only when it is consumed."""
+        for condition in conditions:
+            try:
+                result = self.detection_engine.evaluate_condition(condition)
+            except Exception as e:
+                self.logger.log_error(f"Error evaluating condition {condition.type} at {condition.position}", "monitor", e)
+                yield False
+                continue
+            self._log_detection(condition, result)
+            if self.debug:
+                self.logger.log_debug(f"{label} {condition.type}:{condition.value} at {condition.position} = {result}", "monitor")
+            yield result
+
+    def _log_detection(self, condition: Condition, result: bool) -> None:
+        # Repeated results are only counted by the logger, so don't rebuild the details each tick
+        details = self._detection_details.get(id(condition))
+        if details is None:
+            details = detection_details(condition)
+        self.logger.log_detection(condition.position, condition.type, result, details)
         
     def _monitor_loop(self) -> None:
         """
         Main monitoring loop that runs in a separate thread.
         """
-        print("Monitor loop started")
+        self.logger.log_debug("Monitor loop started", "monitor")
         
         while self.is_monitoring:
             try:
                 # Skip monitoring if we're processing a match (during delay/popup)
                 if self.is_processing_match:
-                    time.sleep(0.1)  # Short sleep to avoid busy waiting
+                    self._resume_event.wait()
                     continue
                 
                 # Check each rule
-                for rule in self.config.rules:
+                for compiled in self._compiled_rules:
                     if not self.is_monitoring or self.is_processing_match:
                         break
                         
-                    if self.evaluate_rule(rule):
-                        print(f"Rule matched! Logic: {rule.logic}")
+                    rule = compiled.rule
+                    if self._evaluate_compiled(compiled):
+                        self.logger.log_info(f"Rule matched! Logic: {rule.logic}", "monitor")
                         
                         # Set processing flag to pause further monitoring
                         self.is_processing_match = True
@@ -196,7 +264,7 @@ class ScreenMonitor:
                             try:
                                 self.on_rule_matched(rule)
                             except Exception as e:
-                                print(f"Error in rule matched callback: {e}")
+                                self.logger.log_error("Error in rule matched callback", "monitor", e)
                                 # Reset flag on error
                                 self.is_processing_match = False
                         
@@ -205,57 +273,70 @@ class ScreenMonitor:
                         
                 # Wait before next check (only if not processing)
                 if not self.is_processing_match:
-                    time.sleep(self.monitor_interval)
+                    if self._stop_event.wait(self.monitor_interval):
+                        break
                 
             except Exception as e:
-                print(f"Error in monitor loop: {e}")
-                time.sleep(self.monitor_interval)
+                self.logger.log_error("Error in monitor loop", "monitor", e)
+                if self._stop_event.wait(self.monitor_interval):
+                    break
                 
-        print("Monitor loop ended")
+        self.logger.log_debug("Monitor loop ended", "monitor")
     
     def resume_monitoring(self):
         """Resume monitoring after user intervention is complete"""
         self.is_processing_match = False
-        print("Monitoring resumed after user intervention")
+        self.logger.log_info("Monitoring resumed after user intervention", "monitor")
         
-    def _apply_rule_logic(self, logic: str, condition_results: List[bool], n: Optional[int] = None) -> bool:
+    def _apply_rule_logic(self, logic: str, condition_results: Iterable[bool], n: Optional[int] = None) -> bool:
         """
         Apply the specified logic to condition results.
         
         Args:
             logic: Type of logic ('any', 'all', 'n-of')
-            condition_results: List of boolean results from condition evaluations
+            condition_results: Boolean results from condition evaluations; may be a
+                lazy iterator, which 'any' and 'all' stop consuming once decided
             n: Required number of conditions for 'n-of' logic
             
         Returns:
             True if logic is satisfied, False otherwise
         """
-        if not condition_results:
-            print(f"WARNING: No condition results to evaluate for {logic} logic")
-            return False
-            
+        logic_key = logic.lower()
         # Add detailed debugging for each logic type
-        if logic.lower() == 'any':
+        if logic_key == 'any':
             result = any(condition_results)
-            print(f"ANY (OR) logic with {condition_results} = {result}")
+            if self.debug:
+                self.logger.log_debug(f"ANY (OR) logic = {result}", "monitor")
             return result
-        elif logic.lower() == 'all':
+        elif logic_key == 'all':
             result = all(condition_results)
-            print(f"ALL (AND) logic with {condition_results} = {result}")
+            if self.debug:
+                self.logger.log_debug(f"ALL (AND) logic = {result}", "monitor")
             return result
-        elif logic.lower() == 'n-of':
+        elif logic_key == 'n-of':
             if n is None or n <= 0:
-                print(f"Invalid n value '{n}' for n-of logic")
+                if self.debug:
+                    self.logger.log_debug(f"Invalid n value '{n}' for n-of logic", "monitor")
                 return False
-            true_count = sum(1 for r in condition_results if r)  # More reliable than sum()
-            result = true_count >= n
-            print(f"N-OF logic with n={n}, results={condition_results}, true_count={true_count}, result={result}")
+            # Stop consuming (and detecting) once n results are True
+            true_count = 0
+            result = False
+            for r in condition_results:
+                if r:
+                    true_count += 1
+                    if true_count >= n:
+                        result = True
+                        break
+            if self.debug:
+                self.logger.log_debug(f"N-OF logic with n={n}, true_count={true_count}, result={result}", "monitor")
             return result
         else:
-            print(f"Unknown logic type: '{logic}' - defaulting to ANY logic")
+            if self.debug:
+                self.logger.log_debug(f"Unknown logic type: '{logic}' - defaulting to ANY logic", "monitor")
             # Default to ANY logic as a fallback
             result = any(condition_results)
-            print(f"Defaulted to ANY logic with {condition_results} = {result}")
+            if self.debug:
+                self.logger.log_debug(f"Defaulted to ANY logic = {result}", "monitor")
             return result
             
     def update_config(self, new_config: Config) -> None:
@@ -278,7 +359,7 @@ class ScreenMonitor:
         if was_monitoring:
             self.start_monitoring()
             
-        print("Configuration updated")
+        self.logger.log_info("Configuration updated", "monitor")
         
     def get_status(self) -> dict:
         """
@@ -1,10 +1,9 @@
 import tkinter as tk
 from tkinter import messagebox
-import datetime
+import threading
+import time
 
 from config import Config
-from delay_popup import DelayPopupManager
-from clicker import MouseClicker
 from logger import get_logger
 from diagnostics import run_startup_diagnostics
 
@@ -15,12 +14,6 @@ from ui_groups import UIGroupsMixin
 from ui_config import UIConfigMixin
 from ui_monitoring import UIMonitoringMixin
 
-# Optional: modern theming with ttkbootstrap (falls back gracefully if unavailable)
-try:
-    import ttkbootstrap as ttkb
-except Exception:  # pragma: no cover - optional dependency
-    ttkb = None
-
 
 class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin, 
                          UIConfigMixin, UIMonitoringMixin):
@@ -48,7 +41,12 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
         tk.Label(self.splash, text="Advanced Autoclicker\nInitializing...", font=("Helvetica", 12)).pack(expand=True)
         self.splash.update_idletasks()
 
-        # Apply a modern theme if ttkbootstrap is available
+        # Apply a modern theme if ttkbootstrap is available. Imported here, after
+        # the splash is up, rather than at module load.
+        try:
+            import ttkbootstrap as ttkb
+        except Exception:  # pragma: no cover - optional dependency
+            ttkb = None
         self.style = None
         if ttkb is not None:
             try:
@@ -84,9 +82,11 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
         # Initialize core components
         self.config = Config(rules=[])
         self.monitor = None
+        from delay_popup import DelayPopupManager
         self.delay_popup_manager = DelayPopupManager()
         self.delay_popup_manager.set_parent_window(self.root)
-        self.mouse_clicker = MouseClicker()
+        # MouseClicker pulls in pyautogui; created on first click (see mouse_clicker)
+        self._mouse_clicker = None
 
         # Always initialize these attributes
         self.selected_click_position = None
@@ -104,6 +104,17 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
         self.monitor_status_label = None
         self.click_count_label = None
         self.last_action_label = None
+        # Coalesced label repaints (see UIMonitoringMixin.update_labels); the lock
+        # covers these three, since the monitor thread queues updates too
+        self._label_lock = threading.Lock()
+        self._pending_label_state = {}
+        self._label_flush_pending = False
+        self._last_label_update = 0.0
+        # Pending debounced delay-field update (see _debounced_delay_change)
+        self._delay_after = None
+        self._desc_cache = {}  # (id, revision) -> condition description
+        # (rule, _describe_rule(rule)) taken when monitoring started, reused on every match
+        self._active_rule_info = (None, None)
 
         # Set up the modern UI
         self.setup_ui()
@@ -127,20 +138,32 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
         # Size window to content and center it
         self.size_window_to_content()
         
-        # Optimize window size after UI creation
-        self.root.after(100, self.optimize_window_size)
+        # Optimize window size once the window is actually shown
+        self._first_map_binding = self.root.bind('<Map>', self._on_first_map, add='+')
         
         # Set up window resizing constraints
+        self._resize_after_id = None
+        self._last_root_size = None
         self.setup_window_constraints()
         
         # Initialize the selected color to None
         self.selected_color = None
         
+    @property
+    def mouse_clicker(self):
+        """MouseClicker, created (and pyautogui imported) on first use."""
+        if self._mouse_clicker is None:
+            from clicker import MouseClicker
+            self._mouse_clicker = MouseClicker()
+        return self._mouse_clicker
+        
     def size_window_to_content(self):
-        """Size the window to fit its content properly and center it."""
-        # Update all widgets to get accurate size
-        self.root.update_idletasks()
+        """Size the window to fit its content properly and center it.
         
+        Requested sizes are read directly: __init__ has already flushed
+        geometry once after setup_ui, and another root-wide update_idletasks()
+        here would only re-run layout and queue more <Configure> events.
+        """
         # Get the required size for the content with proper calculations
         # Consider both tabs and pick the larger requirement
         notebook_width = self.notebook.winfo_reqwidth()
@@ -163,10 +186,17 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
         # Center the window on screen
         self.center_window(self.root, width, height)
         
+    def _on_first_map(self, event):
+        """Run optimize_window_size once, when the root window first becomes visible."""
+        # <Map> bound on the root also fires for every child widget being mapped
+        if event.widget is not self.root:
+            return
+        self.root.unbind('<Map>', self._first_map_binding)
+        self.optimize_window_size()
+        
     def center_window(self, window, width, height):
         """Center a window on the screen"""
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
+        screen_width, screen_height = self._get_screen_size(window)
         x = (screen_width - width) // 2
         y = (screen_height - height) // 2
         window.geometry(f"{width}x{height}+{x}+{y}")
@@ -180,27 +210,36 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
         self.root.bind('<Configure>', self.on_window_configure)
         
     def on_window_configure(self, event):
-        """Handle window resize events to maintain proper scaling."""
+        """Handle window resize events to maintain proper scaling.
+        
+        Tk fires <Configure> many times per second while the user drags the
+        window edge, so the scroll-region update is debounced to run once,
+        50 ms after the last size change.
+        """
         # Only handle window (root) resize events, not child widgets
-        if event.widget == self.root:
-            # Update scroll region when window is resized
-            if hasattr(self, 'canvas'):
-                self.root.after_idle(lambda: self.canvas.configure(
-                    scrollregion=self.canvas.bbox("all")
-                ))
-                
-            # If window was resized smaller than content, ensure content is still accessible
-            if hasattr(self, 'scrollable_frame'):
-                self.root.after_idle(self._ensure_content_visibility)
+        if event.widget is not self.root:
+            return
+        # Moves and other non-size Configure events need no relayout
+        size = (event.width, event.height)
+        if size == self._last_root_size:
+            return
+        self._last_root_size = size
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(50, self._do_resize_work)
+
+    def _do_resize_work(self):
+        """Apply the last window resize: refresh the scroll region once."""
+        self._resize_after_id = None
+        # If window was resized smaller than content, ensure content is still accessible
+        self._ensure_content_visibility()
                 
     def _ensure_content_visibility(self):
         """Ensure all content remains visible and accessible."""
         if hasattr(self, 'canvas') and hasattr(self, 'scrollable_frame'):
-            # Update canvas scroll region
+            # Update canvas scroll region (once per debounced resize)
             self.canvas.update_idletasks()
-            bbox = self.canvas.bbox("all")
-            if bbox:
-                self.canvas.configure(scrollregion=bbox)
+            self._refresh_scrollregion()
         
     def run(self):
         """Start the Tkinter main loop."""
@@ -211,17 +250,14 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
         if hasattr(self, 'monitor') and self.monitor and getattr(self.monitor, 'is_monitoring', False):
             self.stop_monitoring()
 
-        # Clear all conditions and groups
-        self.conditions = []
-        self.condition_groups = []
-        self.selected_click_position = None
-        self.selected_position = None
-        self.selected_area = None
-        self.selected_color = None
+        # Clear all conditions, groups and selections
+        (self.conditions, self.condition_groups, self.selected_click_position,
+         self.selected_position, self.selected_area, self.selected_color) = ([], [], None, None, None, None)
 
         # Clear the configuration name
-        if hasattr(self, 'config_name_var'):
-            self.config_name_var.set("")
+        config_name_var = getattr(self, 'config_name_var', None)
+        if config_name_var is not None:
+            config_name_var.set("")
 
         # Reset the UI through the components mixin
         self.reset_ui_state()
@@ -235,8 +271,7 @@ class ModernAutoclickerUI(UIComponentsMixin, UIConditionsMixin, UIGroupsMixin,
 
     def get_current_timestamp(self):
         """Get current timestamp for default filenames."""
-        now = datetime.datetime.now()
-        return now.strftime("%Y%m%d_%H%M")
+        return time.strftime("%Y%m%d_%H%M")
 
 
 if __name__ == "__main__":
@@ -11,6 +11,10 @@ Behavior:
  - If env ACLICKER_PREFLIGHT=off -> fully skipped.
  - If env ACLICKER_PREFLIGHT=light (default) -> only tiny screenshot.
  - If env ACLICKER_PREFLIGHT=full  -> screenshot + safe corner click (old behavior).
+ - After the first successful light preflight a marker file is written; later
+   launches skip it (and the pyautogui import) unless mode is full.
+ - Entry points call start_permission_preflight(), which runs it on a daemon
+   thread so the screenshot/click never delays the first Tk frame.
 
 Why defer Accessibility? Users often grant Screen Recording first; clicking
 before Accessibility is granted can yield repeated prompts or failures that
@@ -23,11 +27,48 @@ from __future__ import annotations
 import sys
 import os
 import threading
+from pathlib import Path
 from typing import Optional
 
 _ran_lock = threading.Lock()
 _ran: bool = False
 
+# Written once the Screen Recording prompt has been triggered; macOS only asks once per app
+_MARKER = Path("~/Library/Application Support/AdvancedAutoclicker/.preflight_done").expanduser()
+
+
+def _resolve_log(logger: Optional[object]):
+    """Return (log_error, log_info) callables for ``logger``, falling back to print."""
+    error = getattr(logger, "log_error", None)
+    info = getattr(logger, "log_info", None)
+
+    def log_error(message: str, exc: Exception) -> None:
+        if error is not None:
+            error(message, "preflight", exc)
+        else:
+            print(f"[preflight] {message}")
+
+    def log_info(message: str) -> None:
+        if info is not None:
+            info(message, "preflight")
+        else:
+            print(f"[preflight] {message}")
+
+    return log_error, log_info
+
+
+def start_permission_preflight(logger: Optional[object] = None) -> threading.Thread:
+    """Run :func:`run_permission_preflight` on a background daemon thread.
+
+    The preflight makes no Tk calls, so it can overlap UI construction
+    instead of blocking startup for the screenshot (and click in full mode).
+    """
+    thread = threading.Thread(
+        target=run_permission_preflight, args=(logger,), name="permission-preflight", daemon=True
+    )
+    thread.start()
+    return thread
+
 
 def run_permission_preflight(logger: Optional[object] = None) -> None:
     """Attempt to trigger macOS permission prompts (idempotent).
@@ -52,15 +93,16 @@ def run_permission_preflight(logger: Optional[object] = None) -> None:
     mode = os.environ.get("ACLICKER_PREFLIGHT", "light").lower().strip()
     if mode == "off":
         return
+    if mode != "full" and _MARKER.exists():
+        return
+
+    log_error, log_info = _resolve_log(logger)
 
     # Lazy import so non-mac platforms aren't burdened.
     try:
         import pyautogui  # type: ignore
     except Exception as e:  # pragma: no cover - import failure path
-        if logger and hasattr(logger, "log_error"):
-            logger.log_error(f"Preflight skipped (pyautogui import failed): {e}", "preflight", e)
-        else:
-            print(f"[preflight] Skipped pyautogui import failure: {e}")
+        log_error(f"Preflight skipped (pyautogui import failed): {e}", e)
         return
 
     try:
@@ -68,11 +110,13 @@ def run_permission_preflight(logger: Optional[object] = None) -> None:
         # Always attempt tiny screenshot (Screen Recording prompt)
         try:
             pyautogui.screenshot(region=(0, 0, min(8, width), min(8, height)))
+            try:
+                _MARKER.parent.mkdir(parents=True, exist_ok=True)
+                _MARKER.touch()
+            except OSError:
+                pass
         except Exception as shot_err:
-            if logger and hasattr(logger, "log_error"):
-                logger.log_error(f"Screenshot preflight error: {shot_err}", "preflight", shot_err)
-            else:
-                print(f"[preflight] Screenshot error: {shot_err}")
+            log_error(f"Screenshot preflight error: {shot_err}", shot_err)
 
         did_click = False
         if mode == "full":
@@ -87,10 +131,7 @@ def run_permission_preflight(logger: Optional[object] = None) -> None:
                 pyautogui.PAUSE = old_pause
                 did_click = True
             except Exception as click_err:
-                if logger and hasattr(logger, "log_error"):
-                    logger.log_error(f"Accessibility (click) preflight error: {click_err}", "preflight", click_err)
-                else:
-                    print(f"[preflight] Click error: {click_err}")
+                log_error(f"Accessibility (click) preflight error: {click_err}", click_err)
 
         guidance = [
             "Grant Screen Recording permission if prompted.",
@@ -101,13 +142,6 @@ def run_permission_preflight(logger: Optional[object] = None) -> None:
             guidance.append("Accessibility permission will be requested later when an actual automated click occurs.")
         else:
             guidance.append("Accessibility permission may also have been requested (full mode).")
-        guidance_text = " ".join(guidance)
-        if logger and hasattr(logger, "log_info"):
-            logger.log_info(guidance_text, "preflight")
-        else:
-            print(f"[preflight] {guidance_text}")
+        log_info(" ".join(guidance))
     except Exception as e:  # pragma: no cover - broad safeguard
-        if logger and hasattr(logger, "log_error"):
-            logger.log_error(f"Unexpected preflight error: {e}", "preflight", e)
-        else:
-            print(f"[preflight] Unexpected error: {e}")
+        log_error(f"Unexpected preflight error: {e}", e)
@@ -0,0 +1,33 @@
+"""
+Single-pixel screen reads for the color pickers.
+
+A full ``pyautogui.screenshot()`` captures (and on macOS, PNG-encodes and
+re-decodes) the whole desktop just to read one pixel. ``grab_pixel`` grabs
+only the 1x1 region under the cursor through one reused ``mss`` instance,
+falling back to pyautogui's region grab when mss is not installed.
+"""
+
+from typing import Tuple
+
+_sct = None  # shared mss grabber, created on first use
+
+
+def _mss():
+    global _sct
+    if _sct is None:
+        import mss
+        _sct = mss.mss()
+    return _sct
+
+
+def grab_pixel(x: int, y: int) -> Tuple[int, int, int]:
+    """Return the RGB color of the screen pixel at (x, y)."""
+    try:
+        sct = _mss()
+    except ImportError:
+        import pyautogui
+        # pyautogui.pixel() takes a full screenshot on macOS; grab just the 1x1 region
+        return tuple(pyautogui.screenshot(region=(x, y, 1, 1)).getpixel((0, 0))[:3])
+    raw = sct.grab({"left": x, "top": y, "width": 1, "height": 1}).raw
+    # mss returns BGRA
+    return raw[2], raw[1], raw[0]
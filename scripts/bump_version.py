@@ -20,27 +20,26 @@ from pathlib import Path
 
 VERSION_FILE = Path(__file__).resolve().parent.parent / "version.py"
 SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+_VERSION_SUB_RE = re.compile(r"__version__\s*=\s*['\"](.*?)['\"]")
 
-def read_version() -> str:
+def read_version() -> tuple[str, tuple[int, int, int], str]:
+    """Return (current version, its parsed parts, version.py text) so the file is read only once."""
     text = VERSION_FILE.read_text(encoding="utf-8")
     # Look for __version__ = "x.y.z"
     for line in text.splitlines():
         if "__version__" in line and "=" in line:
             val = line.split("=")[-1].strip().strip("'\"")
-            if SEMVER_RE.match(val):
-                return val
+            m = SEMVER_RE.match(val)
+            if m:
+                major, minor, patch = map(int, m.groups())
+                return val, (major, minor, patch), text
     raise SystemExit("Could not locate current version in version.py")
 
-def write_version(new_version: str):
-    text = VERSION_FILE.read_text(encoding="utf-8")
-    new_text = re.sub(r"__version__\s*=\s*['\"](.*?)['\"]", f"__version__ = \"{new_version}\"", text, count=1)
+def write_version(new_version: str, text: str):
+    new_text = _VERSION_SUB_RE.sub(f"__version__ = \"{new_version}\"", text, count=1)
     VERSION_FILE.write_text(new_text + ("" if new_text.endswith("\n") else "\n"), encoding="utf-8")
 
-def bump(part: str, current: str) -> str:
-    m = SEMVER_RE.match(current)
-    if not m:
-        raise SystemExit(f"Current version '{current}' is not valid semver")
-    major, minor, patch = map(int, m.groups())
+def bump(part: str, major: int, minor: int, patch: int) -> str:
     if part == "major":
         return f"{major + 1}.0.0"
     if part == "minor":
@@ -64,22 +63,22 @@ def main(argv: list[str]):
         new_version = argv[2]
         if not SEMVER_RE.match(new_version):
             raise SystemExit("Version must match X.Y.Z")
-        current = read_version()
+        current, _, text = read_version()
     else:
-        current = read_version()
-        new_version = bump(action, current)
+        current, parts, text = read_version()
+        new_version = bump(action, *parts)
 
     if new_version == current:
         print(f"Version unchanged: {current}")
         return 0
 
-    write_version(new_version)
+    write_version(new_version, text)
     print(f"Version updated: {current} -> {new_version}")
 
     if tag:
         try:
-            git("add", str(VERSION_FILE.relative_to(Path.cwd())))
-            git("commit", "-m", f"chore: bump version to {new_version}")
+            # Committing the path directly stages it too, saving a separate `git add`
+            git("commit", "-m", f"chore: bump version to {new_version}", "--", str(VERSION_FILE.relative_to(Path.cwd())))
             git("tag", f"v{new_version}")
             print(f"Created git tag v{new_version}")
         except subprocess.CalledProcessError as e:
@@ -10,7 +10,9 @@ Features / Improvements:
     * Warns when upscaling (suggests providing ≥1024px source for best quality)
     * macOS: Uses iconutil when available for proper multi-rez .icns
     * Non‑mac fallback produces a PNG placeholder saved with .icns extension (still works in PyInstaller)
-    * Single pass high-quality Lanczos resampling from the original (avoids repeated resizes)
+    * High-quality Lanczos resampling: .icns sizes and the .ico 128/256 px sizes come straight
+      from the original; the smaller .ico sizes cascade from the 256 px image (cheaper, no visible loss)
+    * Each distinct pixel size is resampled once, in parallel (Pillow releases the GIL while resizing)
 
 Outputs:
     build/icons/advanced_autoclicker.icns
@@ -21,12 +23,14 @@ Requires Pillow. Install with: pip install pillow
 
 from __future__ import annotations
 
+import os
 import platform
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 try:
     from PIL import Image
@@ -34,6 +38,11 @@ except ImportError:
     print("Pillow is required. Install with: pip install pillow", file=sys.stderr)
     sys.exit(1)
 
+# Image.Resampling exists from Pillow 9.1; older releases expose the filter on Image
+LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+# Large downscales first box-reduce to within 3x of the target, then Lanczos the rest
+REDUCING_GAP = 3.0
+
 ROOT = Path(__file__).resolve().parent.parent
 # Default fallback icon (should be a high-res square if possible)
 DEFAULT_SOURCE_ICON = ROOT / "docs" / "images" / "screenshot_config.png"
@@ -62,6 +71,18 @@ def _prepare_base(image_path: Path) -> Image.Image:
     return img
 
 
+def _resize(image: Image.Image, size: int) -> Image.Image:
+    return image.resize((size, size), resample=LANCZOS, reducing_gap=REDUCING_GAP)
+
+
+def _resize_all(base_image: Image.Image, sizes: Iterable[int]) -> Dict[int, Image.Image]:
+    """Lanczos-resize ``base_image`` to each distinct square size, in parallel."""
+    unique = sorted(set(sizes))
+    with ThreadPoolExecutor(max_workers=min(len(unique), os.cpu_count() or 1)) as ex:
+        images = ex.map(lambda size: _resize(base_image, size), unique)
+        return dict(zip(unique, images))
+
+
 def build_icns(base_image: Image.Image):
     """Build .icns using iconutil if available, else a minimal fallback.
 
@@ -70,7 +91,7 @@ def build_icns(base_image: Image.Image):
     """
     if platform.system() != "Darwin":
         # Non-macOS: still output something so spec file doesn't break
-        base_image.resize((512, 512), Image.LANCZOS).save(ICNS_PATH, format="PNG")
+        _resize(base_image, 512).save(ICNS_PATH, format="PNG")
         print(f"Created placeholder (non-mac) {ICNS_PATH}")
         return
     try:  # macOS path using iconutil
@@ -79,27 +100,34 @@ def build_icns(base_image: Image.Image):
             iconset = Path(td) / "AppIcon.iconset"
             iconset.mkdir()
             sizes = [16, 32, 64, 128, 256, 512, 1024]
+            retina = (16, 32, 128, 256, 512)
+            # @2x variants are the same pixels as the next size up, so 12 files need only 7 resizes
+            resized = _resize_all(base_image, sizes + [size * 2 for size in retina])
+            # The iconset PNGs are transient (iconutil re-packs them), so favour fast deflate
+            png_opts = {"format": "PNG", "compress_level": 1, "optimize": False}
             for size in sizes:
-                img = base_image.resize((size, size), Image.LANCZOS)
-                png_path = iconset / f"icon_{size}x{size}.png"
-                img.save(png_path, format="PNG")
-                if size in (16, 32, 128, 256, 512):
-                    img2x = base_image.resize((size * 2, size * 2), Image.LANCZOS)
-                    img2x.save(iconset / f"icon_{size}x{size}@2x.png", format="PNG")
+                resized[size].save(iconset / f"icon_{size}x{size}.png", **png_opts)
+                if size in retina:
+                    resized[size * 2].save(iconset / f"icon_{size}x{size}@2x.png", **png_opts)
             subprocess.run(["iconutil", "-c", "icns", str(iconset), "-o", str(ICNS_PATH)], check=True)
         print(f"Created {ICNS_PATH}")
     except Exception as e:  # pragma: no cover - mac utility path
         print(f"iconutil not available or failed ({e}); using fallback simple icns.")
-        base_image.resize((1024, 1024), Image.LANCZOS).save(ICNS_PATH, format="PNG")
+        _resize(base_image, 1024).save(ICNS_PATH, format="PNG")
         print(f"Created fallback {ICNS_PATH}")
 
 
 def build_ico(base_image: Image.Image):
     sizes = [16, 24, 32, 48, 64, 128, 256]
-    # Resize each directly from original base for max quality
-    variants = [base_image.resize((s, s), Image.LANCZOS) for s in sizes]
-    # Pillow accepts one image with sizes param
-    variants[0].save(ICO_PATH, format="ICO", sizes=[(s, s) for s in sizes])
+    # Sizes >=128 come straight from the original base for max quality; the
+    # small ones are resampled from the 256px variant, which is
+    # indistinguishable at that scale and ~16x fewer source pixels per pass.
+    resized = _resize_all(base_image, [s for s in sizes if s >= 128])
+    resized.update(_resize_all(resized[256], [s for s in sizes if s < 128]))
+    # Save from the largest and hand Pillow the exact variants for the smaller sizes
+    largest = resized[sizes[-1]]
+    largest.save(ICO_PATH, format="ICO", sizes=[(s, s) for s in sizes],
+                 append_images=[resized[s] for s in sizes[:-1]])
     print(f"Created {ICO_PATH}")
 
 
@@ -1,19 +1,64 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pyautogui
 import json
+import time
+from typing import NamedTuple
  
 from config import Condition, Rule, Config, ConditionGroup
-from monitor import ScreenMonitor
 from delay_popup import DelayPopupManager
-from clicker import MouseClicker
 from logger import get_logger
+from screen_pixel import grab_pixel
+
+# (menu label, ttkbootstrap theme name) for the Theme menu
+_THEMES = (
+    ("Cosmo (Light)", "cosmo"),
+    ("Flatly (Light)", "flatly"),
+    ("Journal (Light)", "journal"),
+    ("Morph (Light)", "morph"),
+    ("Solar (Light)", "solar"),
+    ("Cyborg (Dark)", "cyborg"),
+    ("Darkly (Dark)", "darkly"),
+    ("Superhero (Dark)", "superhero"),
+)
+
+
+def _color_value_desc(value):
+    """RGB(r,g,b) for an RGB tuple, else the value as-is."""
+    if isinstance(value, tuple) and len(value) == 3:
+        return f"RGB({value[0]},{value[1]},{value[2]})"
+    return str(value)
+
+
+def _text_value_desc(value):
+    """Quoted text, truncated if too long."""
+    return f"\"{value[:17]}...\"" if len(value) > 20 else f"\"{value}\""
+
+
+def _valid_tolerance(text):
+    """Spinbox key validation: empty or an integer in 0..50."""
+    return text == "" or (text.isdecimal() and int(text) <= 50)
+
+
+# Condition kind -> position description formatter
+_POS_FMT = {
+    "area": lambda p: f"Area: ({p[0]},{p[1]}) to ({p[2]},{p[3]}) [{p[2]-p[0]}x{p[3]-p[1]}]",
+    "point": lambda p: f"Point({p[0]},{p[1]})",
+}
+
+# Condition type -> value description formatter
+_VALUE_FMT = {
+    "color": _color_value_desc,
+    "text": _text_value_desc,
+}
+
+
+class _RuleSummary(NamedTuple):
+    """What the match/click handlers report about a rule, computed once per match."""
+    total_conditions: int
+    logic: str
+    position: tuple
+    description: str
 
-# Optional: modern theming with ttkbootstrap (falls back gracefully if unavailable)
-try:
-    import ttkbootstrap as ttkb
-except Exception:  # pragma: no cover - optional dependency
-    ttkb = None
 
 class AutoclickerUI:
     def run(self):
@@ -36,8 +81,6 @@ class AutoclickerUI:
             self.config_name_var.set("")
 
         # Reset the UI
-        if hasattr(self, 'conditions_listbox'):
-            self.conditions_listbox.delete(0, tk.END)
         if hasattr(self, 'groups_listbox'):
             for item in self.groups_listbox.get_children():
                 self.groups_listbox.delete(item)
@@ -58,7 +101,12 @@ class AutoclickerUI:
         # Create root window first
         self.root = tk.Tk()
 
-        # Apply a modern theme if ttkbootstrap is available
+        # Apply a modern theme if ttkbootstrap is available. Imported here,
+        # with the other startup-heavy modules, rather than at module load.
+        try:
+            import ttkbootstrap as ttkb
+        except Exception:  # pragma: no cover - optional dependency
+            ttkb = None
         self.style = None
         if ttkb is not None:
             try:
@@ -90,7 +138,8 @@ class AutoclickerUI:
         self.monitor = None
         self.delay_popup_manager = DelayPopupManager()
         self.delay_popup_manager.set_parent_window(self.root)
-        self.mouse_clicker = MouseClicker()
+        # MouseClicker pulls in pyautogui; created on first click (see mouse_clicker)
+        self._mouse_clicker = None
 
         # Always initialize these attributes
         self.selected_click_position = None
@@ -101,28 +150,70 @@ class AutoclickerUI:
 
         # Initialize UI variables before setup_ui
         self.config_name_var = tk.StringVar()  # Optional config name
+        # Pending debounced delay-field update (see _debounced_delay_change)
+        self._delay_after = None
+        # Condition descriptions keyed by (id, revision)
+        self._desc_cache = {}
+        # (rule, _RuleSummary) taken when monitoring started, reused on every match
+        self._active_rule_summary = (None, None)
+        # Advanced color picker window, kept (withdrawn) between uses
+        self._picker_window = None
+        self._picker_after = None
 
         self.setup_ui()
 
         # Perform early permission checks (macOS screen recording & accessibility)
         self.check_and_request_permissions()
         
+    @property
+    def mouse_clicker(self):
+        """MouseClicker, created (and pyautogui imported) on first use."""
+        if self._mouse_clicker is None:
+            from clicker import MouseClicker
+            self._mouse_clicker = MouseClicker()
+        return self._mouse_clicker
+
     def check_and_request_permissions(self):
         """Attempt to trigger macOS permission prompts early and warn user if missing.
         (Non-blocking best-effort – true granting must be done by user in System Settings.)"""
         import sys
         if sys.platform != 'darwin':
             return
+        try:
+            from Quartz import CGPreflightScreenCaptureAccess, CGRequestScreenCaptureAccess
+            from ApplicationServices import AXIsProcessTrustedWithOptions, kAXTrustedCheckOptionPrompt
+        except ImportError:
+            # PyObjC not installed: fall back to the screenshot heuristic
+            self._check_permissions_by_screenshot()
+            return
+        try:
+            # Preflight never prompts; only ask (system dialog) when access is missing
+            screen_ok = CGPreflightScreenCaptureAccess() or CGRequestScreenCaptureAccess()
+            AXIsProcessTrustedWithOptions({kAXTrustedCheckOptionPrompt: True})
+            if not screen_ok:
+                messagebox.showwarning(
+                    "Screen Recording Permission",
+                    "Screen Recording permission is not granted. Please grant 'Screen Recording' permission to this app (Python) in System Settings > Privacy & Security > Screen Recording, then restart the app."
+                )
+        except Exception as e:
+            messagebox.showwarning(
+                "Permissions Required",
+                f"Unable to check screen recording or accessibility permissions.\nPlease grant BOTH 'Screen Recording' and 'Accessibility' permissions to Python in System Settings > Privacy & Security.\nError: {e}"
+            )
+
+    def _check_permissions_by_screenshot(self):
+        """Screenshot-based fallback for check_and_request_permissions without PyObjC."""
+        import pyautogui
         try:
             # Attempt a tiny screenshot to trigger Screen Recording permission prompt (if not already granted)
             img = pyautogui.screenshot()
             # Basic heuristic: if screenshot is uniformly black it could indicate missing permission
-            # (Not definitive, but useful hint.)
-            extrema = img.getextrema()
+            # (Not definitive, but useful hint.) One numpy reduction over the color bands.
             all_black = False
             try:
-                # extrema can be list for multiband
-                all_black = all(ch[0] == 0 and ch[1] == 0 for ch in extrema)
+                import numpy as np
+                arr = np.asarray(img)
+                all_black = not (arr[..., :3] if arr.ndim == 3 else arr).any()
             except Exception:
                 pass
             # Attempt a benign position read to trigger Accessibility (control) permission
@@ -156,24 +247,13 @@ class AutoclickerUI:
         if self.style is not None:
             theme_menu = tk.Menu(menu_bar, tearoff=0)
             menu_bar.add_cascade(label="Theme", menu=theme_menu)
-            themes = [
-                ("Cosmo (Light)", "cosmo"),
-                ("Flatly (Light)", "flatly"),
-                ("Journal (Light)", "journal"),
-                ("Morph (Light)", "morph"),
-                ("Solar (Light)", "solar"),
-                ("Cyborg (Dark)", "cyborg"),
-                ("Darkly (Dark)", "darkly"),
-                ("Superhero (Dark)", "superhero"),
-            ]
-
             def _apply_theme(theme_name: str):
                 try:
                     self.style.theme_use(theme_name)
                 except Exception:
                     pass
 
-            for label, name in themes:
+            for label, name in _THEMES:
                 theme_menu.add_command(label=label, command=lambda n=name: _apply_theme(n))
 
         # Toolbar with most common actions
@@ -242,8 +322,9 @@ class AutoclickerUI:
         self.comparator.set('equals')
 
         ttk.Label(cond_frame, text="Tolerance:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.tolerance = ttk.Scale(cond_frame, from_=0, to=50, orient=tk.HORIZONTAL)
-        self.tolerance.grid(row=3, column=1, padx=5, sticky=(tk.W, tk.E))
+        self.tolerance = ttk.Spinbox(cond_frame, from_=0, to=50, increment=1, width=5, validate='key',
+                                     validatecommand=(self.root.register(_valid_tolerance), '%P'))
+        self.tolerance.grid(row=3, column=1, padx=5, sticky=tk.W)
         self.tolerance.set(10)
 
         ttk.Button(cond_frame, text="Add Condition", command=self.add_condition).grid(row=4, column=0, columnspan=2, pady=10)
@@ -251,15 +332,21 @@ class AutoclickerUI:
         conditions_frame = ttk.LabelFrame(cond_frame, text="Conditions and Groups")
         conditions_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
 
-        self.unified_tree = ttk.Treeview(conditions_frame, columns=('type', 'details', 'logic'), show='tree headings', height=8)
+        self.unified_tree = ttk.Treeview(conditions_frame, columns=('type', 'details', 'logic'), show='tree headings',
+                                         displaycolumns=('type', 'details', 'logic'), height=8)
         self.unified_tree.heading('#0', text='')
         self.unified_tree.heading('type', text='Type')
         self.unified_tree.heading('details', text='Details')
         self.unified_tree.heading('logic', text='Logic')
-        self.unified_tree.column('#0', width=30)
-        self.unified_tree.column('type', width=100)
-        self.unified_tree.column('details', width=300)
-        self.unified_tree.column('logic', width=80)
+        # Fixed widths; only 'details' stretches on resize/theme change
+        self.unified_tree.column('#0', width=30, stretch=False)
+        self.unified_tree.column('type', width=100, stretch=False)
+        self.unified_tree.column('details', width=300, stretch=True)
+        self.unified_tree.column('logic', width=80, stretch=False)
+        # Row tag appearance with distinctive colors (set once; they never change)
+        self.unified_tree.tag_configure('group', background='#d0d0ff', font=('Arial', 9, 'bold'))
+        self.unified_tree.tag_configure('group_condition', background='#e0e0ff')
+        self.unified_tree.tag_configure('condition', background='white')
 
         tree_scrollbar = ttk.Scrollbar(conditions_frame, orient="vertical", command=self.unified_tree.yview)
         self.unified_tree.configure(yscrollcommand=tree_scrollbar.set)
@@ -278,7 +365,6 @@ class AutoclickerUI:
         ttk.Button(action_buttons, text="Remove Selected", command=self.remove_selected_item).pack(side=tk.LEFT, padx=6)
 
         # Backward-compat hidden widgets
-        self.conditions_listbox = tk.Listbox()
         self.groups_listbox = ttk.Treeview(columns=('name', 'logic', 'conditions'))
         self.condition_groups = []
 
@@ -301,7 +387,7 @@ class AutoclickerUI:
         self.delay.grid(row=0, column=1, padx=5)
         self.delay.set('0')
         self.delay.bind('<<ComboboxSelected>>', self._on_delay_change)
-        self.delay.bind('<KeyRelease>', self._on_delay_change)
+        self.delay.bind('<KeyRelease>', self._debounced_delay_change)
         self.delay.bind('<FocusOut>', self._on_delay_change)
         self.popup_var = tk.BooleanVar(value=True)
         self.popup_checkbox = ttk.Checkbutton(settings_frame, text="Show confirmation popup", variable=self.popup_var)
@@ -336,6 +422,7 @@ class AutoclickerUI:
         
     def select_position(self):
         """Let user select a position on screen with real-time feedback"""
+        import pyautogui  # imported on use; pyautogui is slow to load at startup
         # Hide the main window temporarily  
         self.root.withdraw()
         
@@ -349,8 +436,7 @@ class AutoclickerUI:
             self.selected_area = None  # Clear area selection when selecting point
             
             # Also capture the color at this position for reference
-            screenshot = pyautogui.screenshot()
-            pixel_color = screenshot.getpixel(self.selected_position)
+            pixel_color = grab_pixel(*self.selected_position)
             
             self.pos_label.config(text=f"Position: {self.selected_position} (Color: RGB{pixel_color[:3]})")
             
@@ -374,6 +460,7 @@ class AutoclickerUI:
     
     def select_area(self):
         """Let user select an area on screen by clicking two points"""
+        import pyautogui
         self.root.withdraw()
         
         try:
@@ -422,6 +509,7 @@ class AutoclickerUI:
     
     def select_click_position(self):
         """Let user select a separate click position"""
+        import pyautogui
         self.root.withdraw()
         
         try:
@@ -463,6 +551,7 @@ class AutoclickerUI:
             
     def pick_color(self):
         """Capture color from screen at current mouse position"""
+        import pyautogui
         # Hide the main window temporarily
         self.root.withdraw()
         
@@ -475,8 +564,7 @@ class AutoclickerUI:
             mouse_x, mouse_y = pyautogui.position()
             
             # Capture the color at mouse position
-            screenshot = pyautogui.screenshot()
-            pixel_color = screenshot.getpixel((mouse_x, mouse_y))
+            pixel_color = grab_pixel(mouse_x, mouse_y)
             
             # Store RGB values (ignore alpha if present)
             self.selected_color = tuple(pixel_color[:3])
@@ -500,82 +588,54 @@ class AutoclickerUI:
             self.root.deiconify()
     
     def pick_color_advanced(self):
-        """Advanced color picker with real-time preview"""
-        # Create a new window for advanced color picking
+        """Advanced color picker with real-time preview.
+        
+        The picker window is built on first use and withdrawn, not destroyed,
+        when closed; later invocations show the same window again.
+        """
+        if self._picker_window is None or not self._picker_window.winfo_exists():
+            self._build_picker_window()
+        else:
+            self._picker_position_var.set("Move mouse to see position...")
+            self._picker_color_var.set("RGB: (0, 0, 0)")
+            self._picker_window.deiconify()
+            self._picker_window.lift()
+        
+        # Start real-time updates (at most one polling chain)
+        if self._picker_after is None:
+            self._picker_last_pos = None
+            self._picker_last_move = time.monotonic()
+            self._update_picker_preview()
+    
+    def _build_picker_window(self):
+        """Create the advanced color picker window and its widgets."""
+        self._picker_after = None
         picker_window = tk.Toplevel(self.root)
         picker_window.title("Advanced Color Picker")
         picker_window.geometry("400x300")
         picker_window.transient(self.root)
+        picker_window.protocol("WM_DELETE_WINDOW", self._hide_picker_window)
+        self._picker_window = picker_window
         
         # Variables for real-time updates
-        position_var = tk.StringVar(value="Move mouse to see position...")
-        color_var = tk.StringVar(value="RGB: (0, 0, 0)")
+        self._picker_position_var = tk.StringVar(value="Move mouse to see position...")
+        self._picker_color_var = tk.StringVar(value="RGB: (0, 0, 0)")
         
         # UI elements
         ttk.Label(picker_window, text="Real-time Color Picker", font=("Arial", 14, "bold")).pack(pady=10)
-        ttk.Label(picker_window, textvariable=position_var).pack(pady=5)
-        ttk.Label(picker_window, textvariable=color_var, font=("Courier", 12)).pack(pady=5)
+        ttk.Label(picker_window, textvariable=self._picker_position_var).pack(pady=5)
+        ttk.Label(picker_window, textvariable=self._picker_color_var, font=("Courier", 12)).pack(pady=5)
         
         # Color preview canvas
-        canvas = tk.Canvas(picker_window, width=100, height=50, bg="white")
-        canvas.pack(pady=10)
+        self._picker_canvas = tk.Canvas(picker_window, width=100, height=50, bg="white")
+        self._picker_last_hex = None
+        self._picker_canvas.pack(pady=10)
         
         # Control buttons
         button_frame = ttk.Frame(picker_window)
         button_frame.pack(pady=10)
-        
-        def update_preview():
-            """Update real-time preview"""
-            try:
-                # Get current mouse position
-                x, y = pyautogui.position()
-                position_var.set(f"Position: ({x}, {y})")
-                
-                # Get color at mouse position
-                screenshot = pyautogui.screenshot()
-                rgb = screenshot.getpixel((x, y))[:3]
-                color_var.set(f"RGB: {rgb}")
-                
-                # Update color preview
-                hex_color = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-                canvas.configure(bg=hex_color)
-                
-            except Exception:
-                pass  # Ignore errors during preview
-            
-            # Schedule next update
-            if picker_window.winfo_exists():
-                picker_window.after(100, update_preview)
-        
-        def capture_current_color():
-            """Capture the current color and close picker"""
-            try:
-                x, y = pyautogui.position()
-                screenshot = pyautogui.screenshot()
-                rgb = screenshot.getpixel((x, y))[:3]
-                
-                self.selected_color = rgb
-                self.color_label.config(text=f"RGB: {self.selected_color} at ({x}, {y})")
-                
-                # Log color selection
-                self.logger.log_action("PICK_COLOR_ADVANCED", {
-                    "color": self.selected_color, 
-                    "position": (x, y)
-                }, success=True)
-                
-                picker_window.destroy()
-                messagebox.showinfo("Color Captured", 
-                                  f"Captured RGB{self.selected_color} at ({x}, {y})")
-                
-            except Exception as e:
-                self.logger.log_error(f"Error in advanced color picker: {str(e)}", "ui", e)
-                messagebox.showerror("Error", f"Failed to capture color: {str(e)}")
-        
-        ttk.Button(button_frame, text="Capture This Color", command=capture_current_color).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=picker_window.destroy).pack(side=tk.LEFT, padx=5)
-        
-        # Start real-time updates
-        update_preview()
+        ttk.Button(button_frame, text="Capture This Color", command=self._capture_picker_color).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self._hide_picker_window).pack(side=tk.LEFT, padx=5)
         
         # Instructions
         instructions = tk.Text(picker_window, height=4, width=50, wrap=tk.WORD)
@@ -586,91 +646,112 @@ class AutoclickerUI:
             "2. Watch the real-time preview above\n"
             "3. Click 'Capture This Color' when ready")
         instructions.config(state=tk.DISABLED)
+    
+    def _hide_picker_window(self):
+        """Stop the preview polling and withdraw the picker for reuse."""
+        if self._picker_after is not None:
+            self._picker_window.after_cancel(self._picker_after)
+            self._picker_after = None
+        self._picker_window.withdraw()
+    
+    def _update_picker_preview(self):
+        """Update real-time preview"""
+        import pyautogui
+        delay = 50
+        try:
+            # Get current mouse position
+            x, y = pyautogui.position()
+            now = time.monotonic()
+            if (x, y) != self._picker_last_pos:
+                self._picker_last_pos = (x, y)
+                self._picker_last_move = now
+                self._picker_position_var.set(f"Position: ({x}, {y})")
+                
+                # Get color at mouse position
+                rgb = grab_pixel(x, y)
+                self._picker_color_var.set(f"RGB: {rgb}")
+                
+                # Update color preview; reconfiguring the canvas repaints it, so only on change
+                hex_color = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
+                if hex_color != self._picker_last_hex:
+                    self._picker_canvas.configure(bg=hex_color)
+                    self._picker_last_hex = hex_color
+            elif now - self._picker_last_move > 1.0:
+                # Cursor resting: poll less often until it moves again
+                delay = 150
             
-    def add_condition(self):
-        """Add a new condition"""
-        # Check if we have either a position or area selected
-        if not self.selected_position and not self.selected_area:
-            messagebox.showerror("Error", "Please select a position or area first")
-            self.logger.log_error("Failed to add condition: No position/area selected", "ui")
-            return
+        except Exception:
+            pass  # Ignore errors during preview
+        
+        # Schedule next update
+        if self._picker_window.winfo_exists():
+            self._picker_after = self._picker_window.after(delay, self._update_picker_preview)
+        else:
+            self._picker_after = None
+    
+    def _capture_picker_color(self):
+        """Capture the current color and close picker"""
+        import pyautogui
+        try:
+            x, y = pyautogui.position()
+            rgb = grab_pixel(x, y)
             
-        if not self.condition_type.get():
-            messagebox.showerror("Error", "Please select a condition type")
-            self.logger.log_error("Failed to add condition: No condition type selected", "ui")
-            return
+            self.selected_color = rgb
+            self.color_label.config(text=f"RGB: {self.selected_color} at ({x}, {y})")
             
-        if self.condition_type.get() == 'color' and not self.selected_color:
-            messagebox.showerror("Error", "Please pick a color")
-            self.logger.log_error("Failed to add condition: No color selected", "ui")
-            return
+            # Log color selection
+            self.logger.log_action("PICK_COLOR_ADVANCED", {
+                "color": self.selected_color, 
+                "position": (x, y)
+            }, success=True)
             
-        if self.condition_type.get() == 'text' and not self.text_entry.get():
-            messagebox.showerror("Error", "Please enter text to detect")
-            self.logger.log_error("Failed to add condition: No text entered", "ui")
+            self._hide_picker_window()
+            messagebox.showinfo("Color Captured", 
+                              f"Captured RGB{self.selected_color} at ({x}, {y})")
+            
+        except Exception as e:
+            self.logger.log_error(f"Error in advanced color picker: {str(e)}", "ui", e)
+            messagebox.showerror("Error", f"Failed to capture color: {str(e)}")
+            
+    def add_condition(self):
+        """Add a new condition"""
+        # Read each Tk variable once
+        ctype = self.condition_type.get()
+        ctext = self.text_entry.get() if ctype == 'text' else None
+        
+        # Check if we have either a position or area selected, then the value for the type
+        if not self.selected_position and not self.selected_area:
+            error = ("Please select a position or area first", "No position/area selected")
+        elif not ctype:
+            error = ("Please select a condition type", "No condition type selected")
+        elif ctype == 'color' and not self.selected_color:
+            error = ("Please pick a color", "No color selected")
+        elif ctype == 'text' and not ctext:
+            error = ("Please enter text to detect", "No text entered")
+        else:
+            error = None
+        if error:
+            message, reason = error
+            messagebox.showerror("Error", message)
+            self.logger.log_error(f"Failed to add condition: {reason}", "ui")
             return
             
-        value = self.selected_color if self.condition_type.get() == 'color' else self.text_entry.get()
+        value = self.selected_color if ctype == 'color' else ctext
         
         # Use area if selected, otherwise use position
         detection_position = self.selected_area if self.selected_area else self.selected_position
         
         condition = Condition(
-            type=self.condition_type.get(),
+            type=ctype,
             position=detection_position,
             value=value,
             comparator=self.comparator.get(),
-            tolerance=int(self.tolerance.get())
+            tolerance=int(self.tolerance.get() or 10)
         )
         
         self.conditions.append(condition)
         
-        # Create a more descriptive condition string
-        position_desc = ""
-        if len(condition.position) == 4:
-            x1, y1, x2, y2 = condition.position
-            width, height = x2-x1, y2-y1
-            position_desc = f"Area: ({x1},{y1}) to ({x2},{y2}) [{width}x{height}]"
-        else:
-            x, y = condition.position
-            # position_desc = f"Point({x},{y})"  # unused
-            
-        # Create friendly descriptions for each element
-    # type_desc = "📊 Color" if condition.type == "color" else "📝 Text"  # unused
-        
-        value_desc = ""
-        if condition.type == "color":
-            if isinstance(condition.value, tuple) and len(condition.value) == 3:
-                r, g, b = condition.value
-                value_desc = f"RGB({r},{g},{b})"
-            else:
-                value_desc = str(condition.value)
-        elif condition.type == "text":
-            # Truncate text if too long
-            if len(condition.value) > 20:
-                value_desc = f"\"{condition.value[:17]}...\""
-            else:
-                value_desc = f"\"{condition.value}\""
-        else:
-            pass
-        
-        # Simplified comparison description
-        comp_desc = ""
-        if condition.type == "color":
-            if condition.comparator == "equals":
-                comp_desc = "exactly matches"
-            elif condition.comparator == "similar":
-                comp_desc = f"is similar to (tolerance: {condition.tolerance})"
-        else:  # Text
-            if condition.comparator == "equals":
-                comp_desc = "exactly matches"
-            elif condition.comparator == "contains":
-                comp_desc = "contains"
-            elif condition.comparator == "similar":
-                pass
-        
-        # We already added the condition earlier, no need to append again
-        # Just update the display to show the new condition
+        # Update the display to show the new condition
         self.update_conditions_display()
         
         # Log the condition addition
@@ -684,12 +765,8 @@ class AutoclickerUI:
         
     def _conditions_equal(self, cond1, cond2):
         """Compare two conditions for equality"""
-        # Two conditions are equal if they have the same type, position, value, and comparator
-        return (cond1.type == cond2.type and 
-                cond1.position == cond2.position and
-                cond1.value == cond2.value and 
-                cond1.comparator == cond2.comparator and
-                cond1.tolerance == cond2.tolerance)
+        # Two conditions are equal if they have the same type, position, value, comparator and tolerance
+        return cond1.key == cond2.key
     
     def _condition_in_list(self, condition, condition_list):
         """Check if a condition is in a list using our custom equality check"""
@@ -707,28 +784,17 @@ class AutoclickerUI:
         # First, make sure the main conditions list contains all conditions
         self._ensure_conditions_consistency()
         
-        # Clear the tree view
-        for item in self.unified_tree.get_children():
-            self.unified_tree.delete(item)
+        # Rows are collected first and inserted in one batch by extend_tree
+        rows = []
         
-        # Also clear the hidden compatibility listbox
-        self.conditions_listbox.delete(0, tk.END)
-        
-        # Track which conditions are in groups
-        conditions_in_groups = []
-        for group in self.condition_groups:
-            for condition in group.conditions:
-                if not self._condition_in_list(condition, conditions_in_groups):
-                    conditions_in_groups.append(condition)
+        # Track which conditions are in groups, by identity
+        group_ids = {id(condition) for group in self.condition_groups for condition in group.conditions}
         
         # First add all the groups as parent items, except 'Default Group'
         group_display_index = 0
         for i, group in enumerate(self.condition_groups):
             if group.name == "Default Group":
                 # Show these as standalone, not as a group
-                for condition in group.conditions:
-                    if not self._condition_in_list(condition, conditions_in_groups):
-                        conditions_in_groups.append(condition)
                 continue
             # Format the logic text
             if group.logic == "all":
@@ -743,9 +809,7 @@ class AutoclickerUI:
             # Add the group as a parent item
             group_id = f"group_{group_display_index}"
             group_display_index += 1
-            self.unified_tree.insert('', 'end', group_id, text='▼', 
-                                  values=('Group', group.name, logic_text),
-                                  tags=('group',))
+            rows.append(('', group_id, '▼', ('Group', group.name, logic_text), ('group',)))
 
             # Add conditions within this group
             for j, condition in enumerate(group.conditions):
@@ -753,49 +817,55 @@ class AutoclickerUI:
                 condition_text = self._format_condition_description(condition)
 
                 # Add as child of group
-                self.unified_tree.insert(group_id, 'end', f"{group_id}_cond_{j}", text='',
-                                     values=('Condition', condition_text, ''),
-                                     tags=('group_condition',))
+                rows.append((group_id, f"{group_id}_cond_{j}", '', ('Condition', condition_text, ''), ('group_condition',)))
         
         # Then add standalone conditions (those not in any group)
-        standalone_conditions = []
-        
-        # Debug information
-        condition_ids = [id(c) for c in self.conditions]
-        group_condition_ids = [id(c) for c in conditions_in_groups]
-        
-        print(f"All condition IDs: {condition_ids}")
-        print(f"Group condition IDs: {group_condition_ids}")
-        
-        for condition in self.conditions:
-            # For each condition in the main list, check if it's in any group
-            condition_in_group = False
-            for group_condition in conditions_in_groups:
-                if id(condition) == id(group_condition) or self._conditions_equal(condition, group_condition):
-                    condition_in_group = True
-                    break
-                    
-            if not condition_in_group:
-                standalone_conditions.append(condition)
+        standalone_conditions = [c for c in self.conditions if id(c) not in group_ids]
                 
-        print(f"Standalone conditions: {len(standalone_conditions)}, Total conditions: {len(self.conditions)}, In groups: {len(conditions_in_groups)}")
+        # Debug information (the id lists are only built when debug logging is on)
+        if self.logger.debug_enabled:
+            self.logger.log_debug(f"All condition IDs: {[id(c) for c in self.conditions]}", "ui")
+            self.logger.log_debug(f"Group condition IDs: {list(group_ids)}", "ui")
+            self.logger.log_debug(f"Standalone conditions: {len(standalone_conditions)}, Total conditions: {len(self.conditions)}, In groups: {len(group_ids)}", "ui")
+            # Standalone copies equal to a grouped condition point at a duplicate-object bug
+            group_keys = {c.key for group in self.condition_groups for c in group.conditions}
+            duplicates = sum(1 for c in standalone_conditions if c.key in group_keys)
+            if duplicates:
+                self.logger.log_debug(f"{duplicates} standalone condition(s) duplicate a grouped condition", "ui")
                 
         for i, condition in enumerate(standalone_conditions):
             # Format condition description
             condition_text = self._format_condition_description(condition)
             
             # Add as standalone item
-            self.unified_tree.insert('', 'end', f"cond_{i}", text='',
-                                values=('Condition', condition_text, ''),
-                                tags=('condition',))
-            
-            # Also add to the hidden listbox for backward compatibility
-            self.conditions_listbox.insert(tk.END, condition_text)
+            rows.append(('', f"cond_{i}", '', ('Condition', condition_text, ''), ('condition',)))
+        
+        self.extend_tree(rows)
+    
+    def extend_tree(self, rows):
+        """Replace the contents of the unified tree with ``rows`` in one batch.
+        
+        Each row is ``(parent, iid, text, values, tags)``. The scrollbar is
+        detached while rows go in, so it is updated once at the end rather
+        than after every insert.
+        """
+        tree = self.unified_tree
+        yscroll = tree.cget('yscrollcommand')
+        tree.configure(yscrollcommand='')
+        try:
+            tree.delete(*tree.get_children())
+            insert = tree.insert
+            for parent, iid, text, values, tags in rows:
+                insert(parent, 'end', iid=iid, text=text, values=values, tags=tags)
+        finally:
+            tree.configure(yscrollcommand=yscroll)
     
     def _ensure_conditions_consistency(self):
         """Ensure that self.conditions only contains standalone conditions (not in any group)."""
-        print("Starting condition consistency check...")
-        print(f"Before: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}")
+        debug = self.logger.debug_enabled
+        if debug:
+            self.logger.log_debug("Starting condition consistency check...", "ui")
+            self.logger.log_debug(f"Before: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}", "ui")
 
         # Build a set of all group condition ids
         group_condition_ids = set()
@@ -810,39 +880,29 @@ class AutoclickerUI:
         # Optionally, update group references to use the same object as in self.conditions if needed
         # (not strictly necessary if conditions are only in one place)
 
-        print(f"After: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}")
-                
-        # Configure tag appearance with more distinctive colors
-        self.unified_tree.tag_configure('group', background='#d0d0ff', font=('Arial', 9, 'bold'))
-        self.unified_tree.tag_configure('group_condition', background='#e0e0ff')
-        self.unified_tree.tag_configure('condition', background='white')
+        if debug:
+            self.logger.log_debug(f"After: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}", "ui")
         
     def _format_condition_description(self, condition):
+        """Format a condition into a readable description string (cached per revision)"""
+        key = (id(condition), condition.revision)
+        desc = self._desc_cache.get(key)
+        if desc is None:
+            if len(self._desc_cache) > 1024:  # drop entries for old revisions
+                self._desc_cache.clear()
+            desc = self._desc_cache[key] = self._build_condition_description(condition)
+        return desc
+    
+    def _build_condition_description(self, condition):
         """Format a condition into a readable description string"""
         # Position description
-        if len(condition.position) == 4:
-            x1, y1, x2, y2 = condition.position
-            width, height = x2-x1, y2-y1
-            position_desc = f"Area: ({x1},{y1}) to ({x2},{y2}) [{width}x{height}]"
-        else:
-            x, y = condition.position
-            position_desc = f"Point({x},{y})"
+        position_desc = _POS_FMT[condition.kind](condition.position)
             
         # Type icon
         type_desc = "📊 Color" if condition.type == "color" else "📝 Text"
         
-        # Value description
-        if condition.type == "color":
-            if isinstance(condition.value, tuple) and len(condition.value) == 3:
-                r, g, b = condition.value
-                value_desc = f"RGB({r},{g},{b})"
-            else:
-                value_desc = str(condition.value)
-        else:  # Text
-            if len(condition.value) > 20:
-                value_desc = f"\"{condition.value[:17]}...\""
-            else:
-                value_desc = f"\"{condition.value}\""
+        # Value description (anything but color is shown as text)
+        value_desc = _VALUE_FMT.get(condition.type, _text_value_desc)(condition.value)
         
         # Comparison description
         if condition.type == "color":
@@ -865,14 +925,21 @@ class AutoclickerUI:
         # Format the full condition string
         return f"{type_desc}: {value_desc} {comp_desc} at {position_desc}"
                 
-    def edit_condition(self):
-        """Edit selected condition"""
-        selection = self.conditions_listbox.curselection()
-        if not selection:
+    def _selected_standalone_index(self):
+        """Index into self.conditions of the selected standalone tree row, or None."""
+        selection = self.unified_tree.selection()
+        if selection and selection[0].startswith("cond_"):
+            return int(selection[0].split("_")[1])
+        return None
+    
+    def edit_condition(self, index=None):
+        """Edit the condition at ``index`` in self.conditions (default: the selected one)"""
+        if index is None:
+            index = self._selected_standalone_index()
+        if index is None:
             messagebox.showinfo("Info", "Please select a condition to edit")
             return
             
-        index = selection[0]
         if index >= len(self.conditions):
             return
             
@@ -902,7 +969,7 @@ class AutoclickerUI:
         # Position (display only, can't edit position)
         ttk.Label(dialog, text="Position:").grid(row=1, column=0, padx=10, pady=10, sticky=tk.W)
         
-        if len(condition_to_edit.position) == 4:
+        if condition_to_edit.kind == 'area':
             x1, y1, x2, y2 = condition_to_edit.position
             position_text = f"Area: ({x1},{y1}) to ({x2},{y2})"
         else:
@@ -978,16 +1045,16 @@ class AutoclickerUI:
         
     def remove_condition(self):
         """Remove selected condition"""
-        selection = self.conditions_listbox.curselection()
-        if selection:
-            index = selection[0]
+        index = self._selected_standalone_index()
+        if index is not None and index < len(self.conditions):
             removed_condition = self.conditions[index]
             
             # Check if condition is in a group and remove it from there too
+            key = removed_condition.key
             for group in self.condition_groups:
                 # Need to find the matching condition in the group
                 for i, group_condition in enumerate(group.conditions):
-                    if self._conditions_equal(removed_condition, group_condition):
+                    if group_condition.key == key:
                         group.conditions.pop(i)
                         break
             
@@ -1030,26 +1097,19 @@ class AutoclickerUI:
         if self.click_position:
             click_pos = self.click_position
         elif self.conditions:
-            first_pos = self.conditions[0].position
-            if len(first_pos) == 4:
-                x1, y1, x2, y2 = first_pos
-                click_pos = ((x1 + x2) // 2, (y1 + y2) // 2)
-            else:
-                click_pos = first_pos
+            click_pos = self.conditions[0].center
         elif self.condition_groups and self.condition_groups[0].conditions:
-            first_pos = self.condition_groups[0].conditions[0].position
-            if len(first_pos) == 4:
-                x1, y1, x2, y2 = first_pos
-                click_pos = ((x1 + x2) // 2, (y1 + y2) // 2)
-            else:
-                click_pos = first_pos
+            click_pos = self.condition_groups[0].conditions[0].center
 
-        # Build the rule with both standalone and group conditions
+        # Build the rule with both standalone and group conditions. The lists are
+        # shared, not copied: compile_rule snapshots the standalone list and each
+        # group's member list when monitoring starts, so adding, removing or moving
+        # conditions afterwards does not reach the running monitor.
         rule = Rule(
             click_position=click_pos,
-            condition_groups=self.condition_groups.copy(),
+            condition_groups=self.condition_groups,
             group_logic=self.logic.get() if self.logic.get() else 'any',
-            conditions=self.conditions.copy() if self.conditions else None,
+            conditions=self.conditions or None,
             logic=None,  # Not used in new format
             n=None      # Not used in new format
         )
@@ -1061,6 +1121,7 @@ class AutoclickerUI:
         )
 
         # Create and start monitor
+        from monitor import ScreenMonitor  # pulls in detection (pyautogui, cv2, pytesseract)
         self.monitor = ScreenMonitor(self.config)
         self.monitor.set_rule_matched_callback(self.on_rule_matched)
 
@@ -1071,19 +1132,14 @@ class AutoclickerUI:
             # Log successful monitoring start
             self.logger.log_monitoring("START", rule_count=len(self.config.rules), success=True)
             
-            # Get total condition count (handling both new and old rule structures)
-            if hasattr(rule, 'condition_groups') and rule.condition_groups:
-                total_conditions = sum(len(group.conditions) for group in rule.condition_groups)
-                logic = f"{rule.group_logic} of groups"
-            elif hasattr(rule, 'conditions') and rule.conditions:
-                total_conditions = len(rule.conditions)
-                logic = rule.logic
-            else:
-                total_conditions = 0
-                logic = "unknown"
+            # Summarize the rule once; matches reuse it instead of recounting conditions.
+            # It describes the snapshot the monitor took, even if the lists are edited later.
+            summary = self._summarize_rule(rule)
+            self._active_rule_summary = (rule, summary)
+            logic = f"{summary.logic} of groups" if rule.condition_groups else summary.logic
                 
             self.logger.log_action("START_MONITORING", {
-                "conditions": total_conditions,
+                "conditions": summary.total_conditions,
                 "logic": logic,
                 "delay": self.config.delay,
                 "popup": self.config.popup,
@@ -1110,35 +1166,39 @@ class AutoclickerUI:
         self.logger.log_monitoring("STOP", success=True)
         self.logger.log_action("STOP_MONITORING", {}, success=True)
         
-    def on_rule_matched(self, rule):
-        """Callback when a rule is matched"""
-        # Log rule match - handle both new and old rule structures
-        if hasattr(rule, 'condition_groups') and rule.condition_groups:
+    def _summarize_rule(self, rule):
+        """Condition count, logic, log position and description of a rule (new or old structure)"""
+        click_position = getattr(rule, 'click_position', None)
+        groups = getattr(rule, 'condition_groups', None)
+        if groups:
             # New structure with condition groups
-            total_conditions = sum(len(group.conditions) for group in rule.condition_groups)
-            logic = rule.group_logic
+            total_conditions = sum(len(group.conditions) for group in groups)
             # Get position from click_position or first condition in first group
-            if hasattr(rule, 'click_position') and rule.click_position:
-                position = rule.click_position
-            elif rule.condition_groups and rule.condition_groups[0].conditions:
-                position = rule.condition_groups[0].conditions[0].position
-                # Handle area position
-                if len(position) == 4:
-                    x1, y1, x2, y2 = position
-                    position = ((x1 + x2) // 2, (y1 + y2) // 2)
+            if click_position:
+                position = click_position
+            elif groups[0].conditions:
+                # Center of the area for area conditions
+                position = groups[0].conditions[0].center
             else:
                 position = (0, 0)
-        elif hasattr(rule, 'conditions') and rule.conditions:
+            description = f"{rule.group_logic} of {len(groups)} groups with {total_conditions} total condition(s)"
+            return _RuleSummary(total_conditions, rule.group_logic, position, description)
+        
+        conditions = getattr(rule, 'conditions', None)
+        if conditions:
             # Old structure with direct conditions
-            total_conditions = len(rule.conditions)
-            logic = rule.logic
-            position = rule.conditions[0].position if rule.conditions else (0, 0)
-        else:
-            total_conditions = 0
-            logic = "unknown"
-            position = (0, 0)
-            
-        self.logger.log_rule_match(logic, total_conditions, position)
+            position = click_position or conditions[0].position
+            description = f"{rule.logic} logic with {len(conditions)} condition(s)"
+            return _RuleSummary(len(conditions), rule.logic, position, description)
+        
+        return _RuleSummary(0, "unknown", click_position or (0, 0), "Rule matched")
+    
+    def on_rule_matched(self, rule):
+        """Callback when a rule is matched"""
+        active_rule, summary = self._active_rule_summary
+        if active_rule is not rule:
+            summary = self._summarize_rule(rule)
+        self.logger.log_rule_match(summary.logic, summary.total_conditions, summary.position)
         
         # Get current config settings
         delay_seconds = self.config.delay
@@ -1156,16 +1216,6 @@ class AutoclickerUI:
             else:
                 self.status_label.config(text="🎯 Rule matched! Executing immediately...")
         
-        # Create rule info string for display
-        if hasattr(rule, 'condition_groups') and rule.condition_groups:
-            group_count = len(rule.condition_groups)
-            total_conditions = sum(len(group.conditions) for group in rule.condition_groups)
-            rule_info = f"{rule.group_logic} of {group_count} groups with {total_conditions} total condition(s)"
-        elif hasattr(rule, 'conditions') and rule.conditions:
-            rule_info = f"{rule.logic} logic with {len(rule.conditions)} condition(s)"
-        else:
-            rule_info = "Rule matched"
-        
         # Log delay/popup start
         self.logger.log_delay_popup("START", delay_seconds=delay_seconds, popup_enabled=show_popup)
         
@@ -1173,15 +1223,17 @@ class AutoclickerUI:
         self.delay_popup_manager.handle_rule_matched(
             delay_seconds=delay_seconds,
             show_popup=show_popup,
-            proceed_callback=lambda: self.execute_click_action(rule),
-            rule_info=rule_info,
+            proceed_callback=lambda: self.execute_click_action(rule, summary),
+            rule_info=summary.description,
             cancelled_callback=self.on_action_cancelled,
             stop_monitoring_callback=self.stop_monitoring
         )
         
-    def execute_click_action(self, rule):
+    def execute_click_action(self, rule, summary=None):
         """Execute the click action after delay/popup confirmation"""
         self.status_label.config(text="Executing click action...")
+        if summary is None:
+            summary = self._summarize_rule(rule)
         
         try:
             # Get the selected click type
@@ -1191,11 +1243,7 @@ class AutoclickerUI:
             success = self.mouse_clicker.click_for_rule(rule, click_type=click_type)
             
             # Log the click attempt
-            # Use the new click_position if available, otherwise fallback to first condition
-            if hasattr(rule, 'click_position') and rule.click_position:
-                position = rule.click_position
-            else:
-                position = rule.conditions[0].position if rule.conditions else (0, 0)
+            position = summary.position
             self.logger.log_click(position, click_type, success)
             
             if success:
@@ -1206,19 +1254,9 @@ class AutoclickerUI:
             else:
                 self.status_label.config(text="Click failed!")
                 # Only show error popup for failures (user needs to know about failures)
-                # Create rule info string for error display
-                if hasattr(rule, 'condition_groups') and rule.condition_groups:
-                    group_count = len(rule.condition_groups)
-                    total_conditions = sum(len(group.conditions) for group in rule.condition_groups)
-                    rule_desc = f"{rule.group_logic} of {group_count} groups with {total_conditions} total condition(s)"
-                elif hasattr(rule, 'conditions') and rule.conditions:
-                    rule_desc = f"{rule.logic} logic with {len(rule.conditions)} condition(s)"
-                else:
-                    rule_desc = "Rule matched"
-                    
                 messagebox.showerror("Error", 
                                    f"❌ Failed to execute mouse click!\n"
-                                   f"Rule: {rule_desc}")
+                                   f"Rule: {summary.description}")
                 
         except Exception as e:
             self.status_label.config(text="Click error!")
@@ -1232,6 +1270,16 @@ class AutoclickerUI:
         if self.monitor:
             self.monitor.resume_monitoring()
     
+    def _debounced_delay_change(self, event=None):
+        """Run _on_delay_change once typing in the delay field pauses (200 ms)."""
+        if self._delay_after is not None:
+            self.root.after_cancel(self._delay_after)
+        self._delay_after = self.root.after(200, self._fire_delay_change)
+
+    def _fire_delay_change(self):
+        self._delay_after = None
+        self._on_delay_change()
+
     def _on_delay_change(self, event=None):
         """Handle delay field changes to update popup checkbox state"""
         try:
@@ -1589,7 +1637,6 @@ class AutoclickerUI:
         self.selected_area = None
         
         # Clear UI elements
-        self.conditions_listbox.delete(0, tk.END)
         for item in self.groups_listbox.get_children():
             self.groups_listbox.delete(item)
             
@@ -1918,49 +1965,31 @@ to match when any 2 out of 3 conditions are true."""
             self.condition_groups.pop(group_index)
             
             # Move any conditions that were only in this group back to main list
+            other_group_keys = {c.key for group in self.condition_groups for c in group.conditions}
+            standalone_keys = {c.key for c in self.conditions}
             for condition in group_conditions:
-                # Check if this condition is still in any other group
-                in_other_group = False
-                for group in self.condition_groups:
-                    for group_condition in group.conditions:
-                        if self._conditions_equal(condition, group_condition):
-                            in_other_group = True
-                            break
-                    if in_other_group:
-                        break
-                        
-                # If not in any other group and not already in standalone list, add it
-                if not in_other_group and not self._condition_in_list(condition, self.conditions):
-                    self.conditions.append(condition)
+                key = condition.key
+                # Skip conditions still in another group or already standalone
+                if key in other_group_keys or key in standalone_keys:
+                    continue
+                standalone_keys.add(key)
+                self.conditions.append(condition)
             
             # Update displays
             self.update_groups_display()
             
-    def add_to_group(self):
-        """Add selected condition to a group"""
-        # Check both the unified tree and the legacy listbox for selection
-        selection = self.unified_tree.selection()
-        condition_selection = self.conditions_listbox.curselection()
-        
-        # If we have a tree selection, use that preferentially
-        if selection:
-            item = selection[0]
-            item_type = self.unified_tree.item(item, "values")[0]
-            # Only proceed if it's a standalone condition
-            if item_type == "Condition" and not item.startswith("group_"):
-                # Extract condition index and continue
-                condition_index = int(item.split("_")[1])
-                if condition_index >= len(self.conditions):
-                    messagebox.showinfo("Error", "Invalid condition selection")
-                    return
-            else:
+    def add_to_group(self, condition_index=None):
+        """Add a standalone condition (default: the selected one) to a group"""
+        if condition_index is None:
+            if not self.unified_tree.selection():
+                messagebox.showinfo("Info", "Please select a condition to add to a group")
+                return
+            condition_index = self._selected_standalone_index()
+            if condition_index is None:
                 messagebox.showinfo("Info", "Please select a standalone condition to add to a group")
                 return
-        # Fall back to legacy listbox selection
-        elif condition_selection:
-            condition_index = condition_selection[0]
-        else:
-            messagebox.showinfo("Info", "Please select a condition to add to a group")
+        if condition_index >= len(self.conditions):
+            messagebox.showinfo("Error", "Invalid condition selection")
             return
             
         if not self.condition_groups:
@@ -2001,10 +2030,6 @@ to match when any 2 out of 3 conditions are true."""
                 return
                 
             # Add condition to the group
-            # Use the condition_index we determined earlier
-            if 'condition_index' not in locals():
-                condition_index = condition_selection[0]
-                
             if condition_index >= len(self.conditions):
                 return
                 
@@ -2288,11 +2313,8 @@ to match when any 2 out of 3 conditions are true."""
         if not item.startswith("group_") and self.unified_tree.item(item, "values")[0] == "Condition":
             condition_index = int(item.split("_")[1])
             if condition_index < len(self.conditions):
-                # Set a selection in the hidden listbox for backward compatibility
-                self.conditions_listbox.selection_clear(0, tk.END)
-                self.conditions_listbox.selection_set(condition_index)
                 # Use the existing add_to_group method
-                self.add_to_group()
+                self.add_to_group(condition_index)
                 
     def remove_from_group(self):
         """Remove a condition from its group but keep it in the standalone list"""
@@ -2331,20 +2353,15 @@ to match when any 2 out of 3 conditions are true."""
                 break
                 
         if found:
-            # Set selection in hidden listbox for backward compatibility
-            self.conditions_listbox.selection_clear(0, tk.END)
-            self.conditions_listbox.selection_set(index)
             # Use existing edit method
-            self.edit_condition()
+            self.edit_condition(index)
         else:
             # It might be only in a group but not in main list
             # Add it temporarily to edit
             self.conditions.append(condition)
             index = len(self.conditions) - 1
-            self.conditions_listbox.selection_clear(0, tk.END)
-            self.conditions_listbox.selection_set(index)
             # Edit and remove from main list if needed
-            self.edit_condition()
+            self.edit_condition(index)
             # If it's only in a group, remove from main list
             in_group_only = False
             for group in self.condition_groups:
@@ -2419,7 +2436,7 @@ to match when any 2 out of 3 conditions are true."""
                 value_desc = f"\"{condition.value}\"" if len(condition.value) <= 20 else f"\"{condition.value[:17]}...\""
             
             # Position description
-            if len(condition.position) == 4:
+            if condition.kind == 'area':
                 x1, y1, x2, y2 = condition.position
                 position_desc = f"Area: ({x1},{y1}) to ({x2},{y2})"
             else:
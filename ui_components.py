@@ -2,17 +2,45 @@ import tkinter as tk
 from tkinter import ttk
 
 
+# (menu label, ttkbootstrap theme name) for the Theme menu
+_THEMES = (
+    ("Cosmo (Light)", "cosmo"),
+    ("Flatly (Light)", "flatly"),
+    ("Journal (Light)", "journal"),
+    ("Morph (Light)", "morph"),
+    ("Solar (Light)", "solar"),
+    ("Cyborg (Dark)", "cyborg"),
+    ("Darkly (Dark)", "darkly"),
+    ("Superhero (Dark)", "superhero"),
+)
+
+
+def _valid_tolerance(text):
+    """Spinbox key validation: empty or an integer in 0..50."""
+    return text == "" or (text.isdecimal() and int(text) <= 50)
+
+
 class UIComponentsMixin:
     """
     Mixin class for UI setup and layout components.
     Contains methods for creating and managing the UI layout.
     """
     
+    # Screen size in pixels, queried from Tk once per process (each winfo_* is a Tcl round-trip)
+    _SCREEN_W = None
+    _SCREEN_H = None
+    
+    def _get_screen_size(self, window):
+        """Return (width, height) of the screen, cached after the first query."""
+        if UIComponentsMixin._SCREEN_W is None:
+            UIComponentsMixin._SCREEN_W = window.winfo_screenwidth()
+            UIComponentsMixin._SCREEN_H = window.winfo_screenheight()
+        return UIComponentsMixin._SCREEN_W, UIComponentsMixin._SCREEN_H
+    
     def center_window(self, window, width, height):
         """Center a window on the screen"""
         window.update_idletasks()
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
+        screen_width, screen_height = self._get_screen_size(window)
         x = (screen_width - width) // 2
         y = (screen_height - height) // 2
         window.geometry(f"{width}x{height}+{x}+{y}")
@@ -46,6 +74,10 @@ class UIComponentsMixin:
     
     def setup_ui(self):
         """Set up the modern responsive tabbed UI interface."""
+        # Callables restoring each section's defaults, run in order by reset_ui_state;
+        # sections register them as they create their widgets
+        self._reset_hooks = []
+        
         # Create main notebook for tabs with no padding
         self.notebook = ttk.Notebook(self.root)
         self.notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -75,17 +107,6 @@ class UIComponentsMixin:
         if hasattr(self, 'style') and self.style is not None:
             theme_menu = tk.Menu(menu_bar, tearoff=0)
             menu_bar.add_cascade(label="Theme", menu=theme_menu)
-            themes = [
-                ("Cosmo (Light)", "cosmo"),
-                ("Flatly (Light)", "flatly"),
-                ("Journal (Light)", "journal"),
-                ("Morph (Light)", "morph"),
-                ("Solar (Light)", "solar"),
-                ("Cyborg (Dark)", "cyborg"),
-                ("Darkly (Dark)", "darkly"),
-                ("Superhero (Dark)", "superhero"),
-            ]
-
             def _apply_theme(theme_name: str):
                 try:
                     self.style.theme_use(theme_name)
@@ -93,7 +114,7 @@ class UIComponentsMixin:
                 except Exception as e:
                     self.logger.log_error(f"Failed to apply theme {theme_name}: {e}", "ui")
 
-            for label, name in themes:
+            for label, name in _THEMES:
                 theme_menu.add_command(label=label, command=lambda n=name: _apply_theme(n))
                 
     def setup_main_tab(self):
@@ -118,11 +139,9 @@ class UIComponentsMixin:
         self.scrollbar = ttk.Scrollbar(self.main_tab_frame, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas)
         
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Configure scrolling: the frame's <Configure> fires whenever its children
+        # (or the canvas width) change its size, which is when the region changes.
+        self.scrollable_frame.bind("<Configure>", self._on_scrollable_frame_configure)
         
         # Keep a reference to the window so we can control its width on resize
         self._scrollable_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
@@ -161,6 +180,16 @@ class UIComponentsMixin:
         # Bind mousewheel to canvas
         self._bind_mousewheel()
 
+    def _on_scrollable_frame_configure(self, event=None):
+        """Content size changed: refresh the scroll region."""
+        self._refresh_scrollregion()
+
+    def _refresh_scrollregion(self):
+        """Set the canvas scroll region to canvas.bbox("all")."""
+        bbox = self.canvas.bbox("all")
+        if bbox:
+            self.canvas.configure(scrollregion=bbox)
+
     def _on_canvas_configure(self, event):
         """Keep the scrollable frame width equal to the visible canvas width."""
         try:
@@ -227,6 +256,7 @@ class UIComponentsMixin:
         self.pos_label = ttk.Label(pos_frame, text="No position/area selected", 
                                   font=('Segoe UI', 9), foreground='gray')
         self.pos_label.grid(row=0, column=2, padx=(8, 2), pady=1, sticky=(tk.W, tk.E))  # Reduced padx/pady
+        self._reset_hooks.append(lambda: self.pos_label.config(text="No position/area selected"))
         
     def create_conditions_section(self):
         """Create responsive conditions management section."""
@@ -265,19 +295,13 @@ class UIComponentsMixin:
         ttk.Label(cond_frame, text="Tolerance:", font=('Segoe UI', 10, 'bold')).grid(row=3, column=0, sticky=tk.W, pady=2)  # Reduced pady
         tolerance_frame = ttk.Frame(cond_frame)
         tolerance_frame.grid(row=3, column=1, padx=2, sticky=(tk.W, tk.E), pady=2)  # Reduced padx/pady
-        tolerance_frame.columnconfigure(0, weight=1)
         
-        self.tolerance = ttk.Scale(tolerance_frame, from_=0, to=50, orient=tk.HORIZONTAL)
-        self.tolerance.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 6))  # Reduced padx
+        # Discrete 0..50 value: a validated integer Spinbox rather than a float Scale
+        self.tolerance = ttk.Spinbox(tolerance_frame, from_=0, to=50, increment=1, width=5,
+                                     font=('Segoe UI', 10), validate='key',
+                                     validatecommand=(self.root.register(_valid_tolerance), '%P'))
+        self.tolerance.grid(row=0, column=0, sticky=tk.W)
         self.tolerance.set(10)
-        
-        self.tolerance_label = ttk.Label(tolerance_frame, text="10", width=5)
-        self.tolerance_label.grid(row=0, column=1, sticky=tk.E)
-        
-        # Update tolerance label when changed
-        def update_tolerance_label(value):
-            self.tolerance_label.config(text=f"{int(float(value))}")
-        self.tolerance.config(command=update_tolerance_label)
 
         # Action buttons - positioned under the condition fields
         action_buttons = ttk.Frame(cond_frame)
@@ -298,6 +322,15 @@ class UIComponentsMixin:
         # Initialize the value widgets display
         self.on_type_change()
         
+        def reset_condition_editor():
+            self.condition_type.set('color')
+            self.comparator.set('equals')
+            self.tolerance.set(10)
+            self.text_entry.delete(0, tk.END)
+            self.color_label.config(text="No color selected", foreground='gray')
+            self.on_type_change()
+        self._reset_hooks.append(reset_condition_editor)
+        
     def create_conditions_display(self, parent):
         """Create responsive conditions + groups display (unified tree)."""
         conditions_frame = ttk.LabelFrame(parent, text="Conditions and Groups", padding=(4, 2))  # Reduced padding
@@ -316,16 +349,21 @@ class UIComponentsMixin:
             tree_container,
             columns=("type", "details", "logic"),
             show="tree headings",
+            displaycolumns=("type", "details", "logic"),
             height=5,
         )
         self.unified_tree.heading("#0", text="", anchor="w")
         self.unified_tree.heading("type", text="Type", anchor="w")
         self.unified_tree.heading("details", text="Details", anchor="w")
         self.unified_tree.heading("logic", text="Logic", anchor="w")
-        self.unified_tree.column("#0", width=40, minwidth=30)
-        self.unified_tree.column("type", width=120, minwidth=80)
-        self.unified_tree.column("details", width=350, minwidth=200)
-        self.unified_tree.column("logic", width=100, minwidth=60)
+        # Fixed widths; only "details" stretches, so a resize or theme change
+        # re-lays out one column instead of spreading slack across all four
+        self.unified_tree.column("#0", width=40, minwidth=30, stretch=False)
+        self.unified_tree.column("type", width=120, minwidth=80, stretch=False)
+        self.unified_tree.column("details", width=350, minwidth=200, stretch=True)
+        self.unified_tree.column("logic", width=100, minwidth=60, stretch=False)
+        # Row tag appearance (no background tints)
+        self.unified_tree.tag_configure('group', font=('Arial', 9, 'bold'))
 
         # Scrollbars
         v_scroll = ttk.Scrollbar(tree_container, orient="vertical", command=self.unified_tree.yview)
@@ -342,10 +380,18 @@ class UIComponentsMixin:
         self.unified_tree.bind("<Button-2>", self.show_tree_context_menu)  # some macOS builds
         self.unified_tree.bind("<Control-Button-1>", self.show_tree_context_menu)  # macOS ctrl-click
         self.unified_tree.bind("<Double-1>", self.on_tree_item_double_click)
-
-        # Hidden legacy widgets (compatibility with other mixins)
-        self.conditions_listbox = tk.Listbox()
-        self.groups_listbox = ttk.Treeview(columns=("name", "logic", "conditions"))
+        # Rows last shown by extend_tree, diffed against on the next refresh
+        self._rendered_rows = None
+        # State shown by the last refresh, to skip no-op refreshes
+        self._last_refresh_sig = None
+        # True while a refresh is queued with after_idle (see update_conditions_display)
+        self._refresh_pending = False
+        
+        def clear_tree():
+            self.unified_tree.delete(*self.unified_tree.get_children())
+            self._rendered_rows = None
+            self._last_refresh_sig = None
+        self._reset_hooks.append(clear_tree)
         
     def create_settings_section(self):
         """Create expanded settings section with click position and logic."""
@@ -391,7 +437,7 @@ class UIComponentsMixin:
         self.delay.grid(row=0, column=0, sticky=tk.W)
         self.delay.set('0')
         self.delay.bind('<<ComboboxSelected>>', self._on_delay_change)
-        self.delay.bind('<KeyRelease>', self._on_delay_change)
+        self.delay.bind('<KeyRelease>', self._debounced_delay_change)
         self.delay.bind('<FocusOut>', self._on_delay_change)
         
         # Popup checkbox (will be controlled by delay setting)
@@ -413,6 +459,17 @@ class UIComponentsMixin:
         self.click_type.grid(row=0, column=0, sticky=tk.W)
         self.click_type.set('single')
         
+        def reset_settings():
+            self.click_pos_label.config(text="Click: Not set")
+            self.logic.set('any')
+            self.on_logic_change()
+            self.n_entry.delete(0, tk.END)
+            self.delay.set('0')
+            self._on_delay_change()
+            self.popup_var.set(True)
+            self.click_type.set('single')
+        self._reset_hooks.append(reset_settings)
+        
     def create_control_buttons(self):
         """Create responsive control buttons section."""
         control_frame = ttk.Frame(self.main_frame, padding=(4, 3))  # Reduced padding
@@ -444,6 +501,7 @@ class UIComponentsMixin:
         self.status_label = ttk.Label(status_frame, text="Ready", 
                                      font=('Segoe UI', 10, 'bold'), foreground='green')
         self.status_label.grid(row=0, column=0, pady=3)  # Reduced pady
+        self._reset_hooks.append(lambda: self.status_label.grid(row=0, column=0, pady=3))
         
     def setup_monitoring_tab(self):
         """Set up the monitoring and logs tab."""
@@ -533,60 +591,11 @@ class UIComponentsMixin:
         
     def reset_ui_state(self):
         """Reset all UI elements to their default state."""
-        # Reset labels
-        if hasattr(self, 'pos_label'):
-            self.pos_label.config(text="No position/area selected")
-        if hasattr(self, 'click_pos_label'):
-            self.click_pos_label.config(text="Click: Not set")
-            
-        # Clear tree view
-        if hasattr(self, 'unified_tree'):
-            for item in self.unified_tree.get_children():
-                self.unified_tree.delete(item)
-                
-        # Clear hidden compatibility widgets
-        if hasattr(self, 'conditions_listbox'):
-            self.conditions_listbox.delete(0, tk.END)
-        if hasattr(self, 'groups_listbox'):
-            for item in self.groups_listbox.get_children():
-                self.groups_listbox.delete(item)
-        
-        # Reset condition editor widgets
-        try:
-            if hasattr(self, 'condition_type'):
-                self.condition_type.set('color')
-            if hasattr(self, 'comparator'):
-                self.comparator.set('equals')
-            if hasattr(self, 'tolerance'):
-                self.tolerance.set(10)
-            if hasattr(self, 'tolerance_label'):
-                self.tolerance_label.config(text="10")
-            if hasattr(self, 'text_entry'):
-                self.text_entry.delete(0, tk.END)
-            if hasattr(self, 'color_label'):
-                self.color_label.config(text="No color selected", foreground='gray')
-            if hasattr(self, 'logic'):
-                self.logic.set('any')
-                if hasattr(self, 'on_logic_change'):
-                    self.on_logic_change()
-            if hasattr(self, 'n_entry'):
-                self.n_entry.delete(0, tk.END)
-            if hasattr(self, 'delay'):
-                self.delay.set('0')
-                if hasattr(self, '_on_delay_change'):
-                    self._on_delay_change()
-            if hasattr(self, 'popup_var'):
-                self.popup_var.set(True)
-            if hasattr(self, 'click_type'):
-                self.click_type.set('single')
-            if hasattr(self, 'on_type_change'):
-                self.on_type_change()
-        except Exception:
-            pass
-
-        # Reset status label
-        if hasattr(self, 'status_label'):
-            self.status_label.grid(row=0, column=0, pady=3)  # Reduced pady
+        for hook in self._reset_hooks:
+            try:
+                hook()
+            except Exception:
+                pass
         
     def update_canvas_scroll_region(self):
         """Update the canvas scroll region after content changes."""
@@ -596,6 +605,16 @@ class UIComponentsMixin:
                 self.canvas.configure(scrollregion=self.canvas.bbox("all"))
             ])
             
+    def _debounced_delay_change(self, event=None):
+        """Run _on_delay_change once typing in the delay field pauses (200 ms)."""
+        if self._delay_after is not None:
+            self.root.after_cancel(self._delay_after)
+        self._delay_after = self.root.after(200, self._fire_delay_change)
+
+    def _fire_delay_change(self):
+        self._delay_after = None
+        self._on_delay_change()
+
     def _on_delay_change(self, event=None):
         """Handle delay field changes to update popup checkbox state."""
         try:
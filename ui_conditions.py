@@ -1,7 +1,14 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pyautogui
 from config import Condition
+from screen_pixel import grab_pixel
+
+# Condition kind -> position description formatter
+_POS_FMT = {
+    'area': lambda p: f"area ({p[0]},{p[1]})-({p[2]},{p[3]}) [{p[2]-p[0]}x{p[3]-p[1]}]",
+    'point': lambda p: f"point ({p[0]},{p[1]})",
+}
 
 
 class UIConditionsMixin:
@@ -10,8 +17,12 @@ class UIConditionsMixin:
     Contains methods for creating, editing, and managing conditions.
     """
     
+    # Re-check the standalone/grouped condition invariant on every refresh
+    _debug_consistency = os.environ.get('ADV_UI_DEBUG', '0') == '1'
+    
     def select_position(self):
         """Let user select a position on screen with real-time feedback"""
+        import pyautogui  # imported on use; pyautogui is slow to load at startup
         # Hide the main window temporarily  
         self.root.withdraw()
         
@@ -25,8 +36,7 @@ class UIConditionsMixin:
             self.selected_area = None  # Clear area selection when selecting point
             
             # Also capture the color at this position for reference
-            screenshot = pyautogui.screenshot()
-            pixel_color = screenshot.getpixel(self.selected_position)
+            pixel_color = grab_pixel(*self.selected_position)
             
             self.pos_label.config(text=f"Position: {self.selected_position} (Color: RGB{pixel_color[:3]})")
             
@@ -45,6 +55,7 @@ class UIConditionsMixin:
     
     def select_area(self):
         """Let user select an area on screen by clicking two points"""
+        import pyautogui
         self.root.withdraw()
         
         try:
@@ -84,6 +95,7 @@ class UIConditionsMixin:
     
     def select_click_position(self):
         """Let user select a separate click position"""
+        import pyautogui
         self.root.withdraw()
         
         try:
@@ -119,6 +131,7 @@ class UIConditionsMixin:
             
     def pick_color(self):
         """Capture color from screen at current mouse position"""
+        import pyautogui
         # Hide the main window temporarily
         self.root.withdraw()
         
@@ -128,8 +141,7 @@ class UIConditionsMixin:
             
             # Get mouse position and capture color
             pos = pyautogui.position()
-            screenshot = pyautogui.screenshot()
-            pixel_color = screenshot.getpixel(pos)
+            pixel_color = grab_pixel(*pos)
             
             # Ensure we only store RGB (first 3 values) to avoid RGBA issues
             self.selected_color = pixel_color[:3] if len(pixel_color) > 3 else pixel_color
@@ -154,34 +166,36 @@ class UIConditionsMixin:
             
     def add_condition(self):
         """Add a new condition"""
-        # Check if we have either a position or area selected
+        # Read each Tk variable once
+        ctype = self.condition_type.get()
+        ctext = self.text_entry.get() if ctype == 'text' else None
+        
+        # Check if we have either a position or area selected, then the value for the type
         if not self.selected_position and not self.selected_area:
-            messagebox.showerror("Error", "Please select a position or area first.")
-            return
-            
-        if not self.condition_type.get():
-            messagebox.showerror("Error", "Please select a condition type (Color or Text).")
-            return
-            
-        if self.condition_type.get() == 'color' and not self.selected_color:
-            messagebox.showerror("Error", "Please pick a color first.")
-            return
-            
-        if self.condition_type.get() == 'text' and not self.text_entry.get():
-            messagebox.showerror("Error", "Please enter text to search for.")
+            error = "Please select a position or area first."
+        elif not ctype:
+            error = "Please select a condition type (Color or Text)."
+        elif ctype == 'color' and not self.selected_color:
+            error = "Please pick a color first."
+        elif ctype == 'text' and not ctext:
+            error = "Please enter text to search for."
+        else:
+            error = None
+        if error:
+            messagebox.showerror("Error", error)
             return
             
-        value = self.selected_color if self.condition_type.get() == 'color' else self.text_entry.get()
+        value = self.selected_color if ctype == 'color' else ctext
         
         # Use area if selected, otherwise use position
         detection_position = self.selected_area if self.selected_area else self.selected_position
         
         condition = Condition(
-            type=self.condition_type.get(),
+            type=ctype,
             position=detection_position,
             value=value,
             comparator=self.comparator.get(),
-            tolerance=int(self.tolerance.get())
+            tolerance=int(self.tolerance.get() or 10)
         )
         
         self.conditions.append(condition)
@@ -200,12 +214,8 @@ class UIConditionsMixin:
         
     def _conditions_equal(self, cond1, cond2):
         """Compare two conditions for equality"""
-        # Two conditions are equal if they have the same type, position, value, and comparator
-        return (cond1.type == cond2.type and 
-                cond1.position == cond2.position and
-                cond1.value == cond2.value and 
-                cond1.comparator == cond2.comparator and
-                cond1.tolerance == cond2.tolerance)
+        # Two conditions are equal if they have the same type, position, value, comparator and tolerance
+        return cond1.key == cond2.key
     
     def _condition_in_list(self, condition, condition_list):
         """Check if a condition is in a list using our custom equality check"""
@@ -215,21 +225,36 @@ class UIConditionsMixin:
         return False
     
     def update_conditions_display(self):
+        """Schedule a refresh of the tree view for the next idle tick.
+        
+        Handlers often change several things and refresh after each (e.g.
+        update_conditions_display() then update_groups_display()); calls made
+        before the refresh runs all share it.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._run_pending_refresh)
+    
+    def _run_pending_refresh(self):
+        self._refresh_pending = False
+        self._refresh_conditions_display()
+    
+    def _refresh_conditions_display(self):
         """Update the tree view to display all conditions and groups"""
-        # First, make sure the main conditions list contains all conditions
-        self._ensure_conditions_consistency()
-        
-        # Clear the tree view
-        for item in self.unified_tree.get_children():
-            self.unified_tree.delete(item)
-        
-        # Also clear the hidden compatibility listbox
-        self.conditions_listbox.delete(0, tk.END)
+        # Verify the standalone/grouped invariant (debug runs only)
+        if self._debug_consistency:
+            self._ensure_conditions_consistency()
+        
+        # Nothing to redraw if no condition or group changed since the last refresh;
+        # revisions change on every edit, so in-place edits are not missed
+        sig = (tuple((id(c), c.revision) for c in self.conditions),
+               tuple((g.name, g.logic, g.n, tuple((id(c), c.revision) for c in g.conditions))
+                     for g in self.condition_groups))
+        if sig == self._last_refresh_sig:
+            return
         
-        # Track which conditions are in groups
-        conditions_in_groups = []
-        for group in self.condition_groups:
-            conditions_in_groups.extend(group.conditions)
+        # Rows are collected first and inserted in one batch by extend_tree
+        rows = []
         
         # First add all the groups as parent items, except 'Default Group'
         group_display_index = 0
@@ -241,49 +266,74 @@ class UIConditionsMixin:
                 logic_desc = self._get_logic_description(group.logic, group.n)
                 
                 # Insert group as parent
-                self.unified_tree.insert('', 'end', iid=group_id, text='▼', 
-                                       values=('Group', group.name, logic_desc),
-                                       tags=('group',))
+                rows.append(('', group_id, '▼', ('Group', group.name, logic_desc), ('group',)))
                 
                 # Add group conditions as children
                 for j, condition in enumerate(group.conditions):
                     condition_id = f"group_{group_display_index}_cond_{j}"
                     condition_desc = self._format_condition_description(condition)
-                    self.unified_tree.insert(group_id, 'end', iid=condition_id, text='',
-                                           values=('Condition', condition_desc, ''),
-                                           tags=('group_condition',))
+                    rows.append((group_id, condition_id, '', ('Condition', condition_desc, ''), ('group_condition',)))
                     
                 group_display_index += 1
         
-        # Then add standalone conditions (those not in any group)
-        standalone_conditions = []
-        
-        # Debug information
-        condition_ids = [id(c) for c in self.conditions]
-        group_condition_ids = [id(c) for c in conditions_in_groups]
-        
-        print(f"All condition IDs: {condition_ids}")
-        print(f"Group condition IDs: {group_condition_ids}")
+        # Then add standalone conditions. Every path that moves a condition into
+        # or out of a group pops/appends it on self.conditions, so the list
+        # holds exactly the standalone conditions without rescanning groups.
+        standalone_conditions = self.conditions
         
-        for condition in self.conditions:
-            if not any(id(condition) == id(gc) for gc in conditions_in_groups):
-                standalone_conditions.append(condition)
-                
-        print(f"Standalone conditions: {len(standalone_conditions)}, Total conditions: {len(self.conditions)}, In groups: {len(conditions_in_groups)}")
-                
         for i, condition in enumerate(standalone_conditions):
             condition_desc = self._format_condition_description(condition)
-            self.unified_tree.insert('', 'end', iid=f"standalone_{i}", text='',
-                                   values=('Condition', condition_desc, ''),
-                                   tags=('condition',))
-            
-            # Also add to hidden compatibility listbox
-            self.conditions_listbox.insert(tk.END, condition_desc)
+            rows.append(('', f"standalone_{i}", '', ('Condition', condition_desc, ''), ('condition',)))
+        
+        self.extend_tree(rows)
+        self._last_refresh_sig = sig
+    
+    def extend_tree(self, rows):
+        """Make the unified tree show ``rows``, touching as few items as possible.
+        
+        Each row is ``(parent, iid, text, values, tags)``. When the previously
+        rendered rows are a prefix of ``rows`` (same items in the same places,
+        e.g. after an edit or an appended condition), only changed rows are
+        updated in place and the new ones appended; any other change clears
+        the tree and inserts everything. Inserts run with the scrollbars
+        detached, so they are updated once at the end rather than per row.
+        """
+        tree = self.unified_tree
+        old = self._rendered_rows
+        if old is not None and len(old) <= len(rows) and all(
+                prev[:2] == row[:2] for prev, row in zip(old, rows)):
+            item = tree.item
+            for prev, row in zip(old, rows):
+                if prev != row:
+                    # Text is left alone: it holds the group's collapse marker
+                    item(row[1], values=row[3], tags=row[4])
+            new_rows = rows[len(old):]
+        else:
+            tree.delete(*tree.get_children())
+            new_rows = rows
+        
+        if new_rows:
+            yscroll, xscroll = tree.cget('yscrollcommand'), tree.cget('xscrollcommand')
+            tree.configure(yscrollcommand='', xscrollcommand='')
+            try:
+                insert = tree.insert
+                for parent, iid, text, values, tags in new_rows:
+                    # Groups start expanded, matching their ▼ marker
+                    insert(parent, 'end', iid=iid, text=text, values=values, tags=tags, open=True)
+            finally:
+                tree.configure(yscrollcommand=yscroll, xscrollcommand=xscroll)
+        self._rendered_rows = rows
     
     def _ensure_conditions_consistency(self):
-        """Ensure that self.conditions only contains standalone conditions (not in any group)."""
-        print("Starting condition consistency check...")
-        print(f"Before: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}")
+        """Ensure that self.conditions only contains standalone conditions (not in any group).
+        
+        The add/remove/group paths keep this invariant themselves; this full
+        rescan only runs when ADV_UI_DEBUG=1.
+        """
+        debug = self.logger.debug_enabled
+        if debug:
+            self.logger.log_debug("Starting condition consistency check...", "ui")
+            self.logger.log_debug(f"Before: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}", "ui")
 
         # Build a set of all group condition ids
         group_condition_ids = set()
@@ -298,26 +348,23 @@ class UIConditionsMixin:
         # Optionally, update group references to use the same object as in self.conditions if needed
         # (not strictly necessary if conditions are only in one place)
 
-        print(f"After: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}")
-                
-        # Configure tag appearance without background tints
-        try:
-            self.unified_tree.tag_configure('group', font=('Arial', 9, 'bold'))
-            self.unified_tree.tag_configure('group_condition')
-            self.unified_tree.tag_configure('condition')
-        except Exception:
-            pass
+        if debug:
+            self.logger.log_debug(f"After: Main conditions: {len(self.conditions)}, Group conditions: {sum(len(g.conditions) for g in self.condition_groups)}", "ui")
         
     def _format_condition_description(self, condition):
+        """Format a condition into a readable description string (cached per revision)"""
+        key = (id(condition), condition.revision)
+        desc = self._desc_cache.get(key)
+        if desc is None:
+            if len(self._desc_cache) > 1024:  # drop entries for old revisions
+                self._desc_cache.clear()
+            desc = self._desc_cache[key] = self._build_condition_description(condition)
+        return desc
+    
+    def _build_condition_description(self, condition):
         """Format a condition into a readable description string"""
         # Position description
-        if len(condition.position) == 4:
-            x1, y1, x2, y2 = condition.position
-            width = x2 - x1
-            height = y2 - y1
-            position_desc = f"area ({x1},{y1})-({x2},{y2}) [{width}x{height}]"
-        else:
-            position_desc = f"point ({condition.position[0]},{condition.position[1]})"
+        position_desc = _POS_FMT[condition.kind](condition.position)
             
         # Type icon
         type_desc = "📊 Color" if condition.type == "color" else "📝 Text"
@@ -349,13 +396,19 @@ class UIConditionsMixin:
         else:
             return logic.upper()
             
+    def _selected_standalone_index(self):
+        """Index into self.conditions of the selected standalone tree row, or None."""
+        selection = self.unified_tree.selection()
+        if selection and selection[0].startswith("standalone_"):
+            return int(selection[0].split("_")[1])
+        return None
+
     def edit_condition(self):
         """Edit selected standalone condition via unified dialog"""
-        selection = self.conditions_listbox.curselection()
-        if not selection:
+        index = self._selected_standalone_index()
+        if index is None:
             messagebox.showwarning("No Selection", "Please select a condition to edit.")
             return
-        index = selection[0]
         if index >= len(self.conditions):
             messagebox.showerror("Error", "Invalid condition selected.")
             return
@@ -363,9 +416,8 @@ class UIConditionsMixin:
         
     def remove_condition(self):
         """Remove selected condition"""
-        selection = self.conditions_listbox.curselection()
-        if selection:
-            index = selection[0]
+        index = self._selected_standalone_index()
+        if index is not None:
             if index < len(self.conditions):
                 removed_condition = self.conditions.pop(index)
                 self.update_conditions_display()
@@ -421,21 +473,18 @@ class UIConditionsMixin:
         # If it's a group, toggle collapse
         if "group" in self.unified_tree.item(item, "tags"):
             self.toggle_item_collapse(item)
+            return "break"  # the Treeview class binding would toggle it straight back
         else:
             self.edit_condition_by_id(item)
     
     def toggle_item_collapse(self, item):
         """Toggle collapse/expand state of a tree item"""
+        # Children stay attached and the open flag hides them, so refreshes that
+        # update rows in place (or skip unchanged state) keep the group's state
         if self.unified_tree.item(item, "text") == "▼":
-            self.unified_tree.item(item, text="▶")
-            # Hide children
-            for child in self.unified_tree.get_children(item):
-                self.unified_tree.detach(child)
+            self.unified_tree.item(item, text="▶", open=False)
         else:
-            self.unified_tree.item(item, text="▼")
-            # Show children (they're still in memory, just detached)
-            # This is a simplified implementation
-            pass
+            self.unified_tree.item(item, text="▼", open=True)
     
     def edit_selected_item(self):
         """Edit the selected item in the tree"""
@@ -582,6 +631,7 @@ class UIConditionsMixin:
 
     def _open_condition_edit_dialog(self, condition_to_edit: Condition):
         """Open edit dialog allowing position & value changes (no type switching)."""
+        import pyautogui
         dialog = tk.Toplevel(self.root)
         dialog.title("Edit Condition")
         dialog.minsize(520, 430)
@@ -600,7 +650,7 @@ class UIConditionsMixin:
         ttk.Label(dialog, text="Position / Area:").grid(row=1, column=0, padx=10, pady=10, sticky=tk.W)
         position_var = tk.StringVar()
         def _set_position_text():
-            if len(condition_to_edit.position) == 4:
+            if condition_to_edit.kind == 'area':
                 x1, y1, x2, y2 = condition_to_edit.position
                 w, h = x2 - x1, y2 - y1
                 position_var.set(f"Area: ({x1},{y1}) → ({x2},{y2}) [{w}x{h}]")
@@ -649,8 +699,7 @@ class UIConditionsMixin:
                 try:
                     messagebox.showinfo("Pick Color", "Move mouse over the target color, then press ENTER or SPACE.")
                     pos = pyautogui.position()
-                    screenshot = pyautogui.screenshot()
-                    pixel_color = screenshot.getpixel(pos)[:3]
+                    pixel_color = grab_pixel(*pos)
                     condition_to_edit.value = pixel_color
                     color_var.set(f"RGB{pixel_color}")
                 finally:
@@ -272,7 +272,7 @@ class UIConfigMixin:
         # If we have a position from the first condition, set it as selected
         if self.conditions:
             first_condition = self.conditions[0]
-            if len(first_condition.position) == 4:
+            if first_condition.kind == 'area':
                 self.selected_area = first_condition.position
                 self.selected_position = None
                 x1, y1, x2, y2 = first_condition.position
@@ -288,7 +288,7 @@ class UIConfigMixin:
                 self.pos_label.config(text=position_text)
         elif self.condition_groups and self.condition_groups[0].conditions:
             first_condition = self.condition_groups[0].conditions[0]
-            if len(first_condition.position) == 4:
+            if first_condition.kind == 'area':
                 self.selected_area = first_condition.position
                 self.selected_position = None
                 x1, y1, x2, y2 = first_condition.position
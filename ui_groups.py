@@ -320,19 +320,13 @@ to match when any 2 out of 3 conditions are true."""
             
     def add_to_group(self):
         """Add selected condition to a group"""
-        # Check both the unified tree and the legacy listbox for selection
         selection = self.unified_tree.selection()
-        condition_selection = self.conditions_listbox.curselection()
-        
-        # If we have a tree selection, use that preferentially
         if selection:
             item = selection[0]
             if not item.startswith("standalone_"):
                 messagebox.showwarning("Invalid Selection", "Please select a standalone condition to add to a group.")
                 return
             condition_index = int(item.split("_")[1])
-        elif condition_selection:
-            condition_index = condition_selection[0]
         else:
             messagebox.showwarning("No Selection", "Please select a condition to add to a group.")
             return
@@ -401,20 +395,7 @@ to match when any 2 out of 3 conditions are true."""
                   command=add_condition_to_group).grid(row=2, column=1, padx=10, pady=20)
         
     def update_groups_display(self):
-        """Update the groups list (legacy compatibility) and update the unified tree view"""
-        # Clear the hidden groups listbox (for backward compatibility)
-        for item in self.groups_listbox.get_children():
-            self.groups_listbox.delete(item)
-            
-        # Add each group to hidden compatibility list
-        for i, group in enumerate(self.condition_groups):
-            self.groups_listbox.insert('', 'end', iid=str(i), values=(
-                group.name, 
-                group.logic + (f"({group.n})" if group.n else ""), 
-                len(group.conditions)
-            ))
-        
-        # Now update the main unified tree
+        """Update the unified tree view after a group change"""
         self.update_conditions_display()
     
     def edit_group_by_id(self, item_id):
@@ -463,11 +444,11 @@ to match when any 2 out of 3 conditions are true."""
     def on_group_selected(self, event):
         """Legacy method for backward compatibility"""
         # This is kept for backward compatibility with old code
-        selection = self.groups_listbox.selection()
-        if not selection:
+        selection = self.unified_tree.selection()
+        if not selection or not selection[0].startswith("group_") or "_cond_" in selection[0]:
             return
             
-        index = int(selection[0])
+        index = int(selection[0].split("_")[1])
         if index >= len(self.condition_groups):
             return
         
@@ -1,7 +1,11 @@
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 from config import Rule
 
+# Monitor labels are repainted at most this often (8 Hz); bursts are coalesced
+LABEL_UPDATE_INTERVAL = 0.125
+
 
 class UIMonitoringMixin:
     """
@@ -197,12 +201,15 @@ class UIMonitoringMixin:
             return
         click_pos = self.selected_click_position
 
-        # Build the rule with both standalone and group conditions
+        # Build the rule with both standalone and group conditions. The lists are
+        # shared, not copied: compile_rule snapshots the standalone list and each
+        # group's member list when monitoring starts, so adding, removing or moving
+        # conditions afterwards does not reach the running monitor.
         rule = Rule(
             click_position=click_pos,
-            condition_groups=self.condition_groups.copy(),
+            condition_groups=self.condition_groups,
             group_logic=self.logic.get() if hasattr(self, 'logic') and self.logic.get() else 'any',
-            conditions=self.conditions.copy() if self.conditions else None,
+            conditions=self.conditions or None,
             logic=None,
             n=None
         )
@@ -237,11 +244,11 @@ class UIMonitoringMixin:
             if hasattr(self, 'lock_configuration'):
                 self.lock_configuration(True)
             
-            if hasattr(self, 'monitor_status_label') and self.monitor_status_label:
-                self.monitor_status_label.config(text="✅ Monitoring active", foreground="green")
+            self.update_labels(status=("✅ Monitoring active", "green"), count="0", action="Monitoring started")
             self.status_label.config(text="Monitoring active...") if hasattr(self, 'status_label') else None
-            if hasattr(self, 'last_action_label') and self.last_action_label:
-                self.last_action_label.config(text="Monitoring started")
+            
+            # Describe the rule once; matches reuse it instead of recounting conditions
+            self._active_rule_info = (rule, self._describe_rule(rule))
             
             # Log monitoring start
             self.logger.log_monitoring("START", success=True)
@@ -288,37 +295,38 @@ class UIMonitoringMixin:
         if hasattr(self, 'lock_configuration'):
             self.lock_configuration(False)
         
-        if hasattr(self, 'monitor_status_label') and self.monitor_status_label:
-            self.monitor_status_label.config(text="⏹️ Monitoring stopped", foreground="orange")
+        self.update_labels(status=("⏹️ Monitoring stopped", "orange"), action="Monitoring stopped")
         self.status_label.config(text="Monitoring stopped") if hasattr(self, 'status_label') else None
-        if hasattr(self, 'last_action_label') and self.last_action_label:
-            self.last_action_label.config(text="Monitoring stopped")
         
         # Log monitoring stop
         self.logger.log_monitoring("STOP", success=True)
         self.logger.log_action("STOP_MONITORING", {}, success=True)
         
+    def _describe_rule(self, rule):
+        """Return (logic, total_conditions, position, rule_info) for a new or old style rule."""
+        groups = getattr(rule, 'condition_groups', None)
+        conditions = getattr(rule, 'conditions', None)
+        if groups:
+            total_conditions = sum(len(g.conditions) for g in groups)
+            return (rule.group_logic or 'any', total_conditions, rule.click_position,
+                    f"{len(groups)} group(s) with {total_conditions} condition(s)")
+        if conditions:
+            return (rule.logic or 'any', len(conditions), rule.click_position,
+                    f"{len(conditions)} condition(s)")
+        return ('any', 0, (0, 0), "No conditions")
+        
     def on_rule_matched(self, rule):
         """Callback when a rule is matched"""
-        # Log rule match - handle both new and old rule structures
-        if hasattr(rule, 'condition_groups') and rule.condition_groups:
-            logic = rule.group_logic or 'any'
-            total_conditions = sum(len(g.conditions) for g in rule.condition_groups)
-            position = rule.click_position
-        elif hasattr(rule, 'conditions') and rule.conditions:
-            logic = rule.logic or 'any'
-            total_conditions = len(rule.conditions)
-            position = rule.click_position
-        else:
-            logic = 'any'
-            total_conditions = 0
-            position = (0, 0)
+        # Reuse the description taken at monitoring start for the running rule
+        active_rule, info = self._active_rule_info
+        if active_rule is not rule:
+            info = self._describe_rule(rule)
+        logic, total_conditions, position, rule_info = info
             
         self.logger.log_rule_match(logic, total_conditions, position)
         
         # Update monitor display
-        if hasattr(self, 'last_action_label') and self.last_action_label:
-            self.last_action_label.config(text="Rule matched - processing...")
+        self.update_labels(action="Rule matched - processing...")
         
         # Get current config settings
         delay_seconds = self.config.delay if hasattr(self.config, 'delay') else 0
@@ -330,16 +338,6 @@ class UIMonitoringMixin:
         else:
             show_popup = show_popup
         
-        # Create rule info string for display
-        if hasattr(rule, 'condition_groups') and rule.condition_groups:
-            group_count = len(rule.condition_groups)
-            condition_count = sum(len(g.conditions) for g in rule.condition_groups)
-            rule_info = f"{group_count} group(s) with {condition_count} condition(s)"
-        elif hasattr(rule, 'conditions') and rule.conditions:
-            rule_info = f"{len(rule.conditions)} condition(s)"
-        else:
-            rule_info = "No conditions"
-        
         # Log delay/popup start
         self.logger.log_delay_popup("START", delay_seconds=delay_seconds, popup_enabled=show_popup)
         
@@ -355,7 +353,7 @@ class UIMonitoringMixin:
         
     def execute_click_action(self, rule):
         """Execute the click action after delay/popup confirmation"""
-        self.last_action_label.config(text="Executing click...")
+        self.update_labels(action="Executing click...")
         self.status_label.config(text="Executing click action...") if hasattr(self, 'status_label') else None
         
         try:
@@ -368,8 +366,7 @@ class UIMonitoringMixin:
             if success:
                 self.click_count += 1
                 self.update_monitor_display()
-                if hasattr(self, 'last_action_label') and self.last_action_label:
-                    self.last_action_label.config(text=f"✅ Click #{self.click_count} successful")
+                self.update_labels(count=str(self.click_count), action=f"✅ Click #{self.click_count} successful")
                 
                 self.logger.log_action("EXECUTE_CLICK", {
                     "position": rule.click_position,
@@ -377,13 +374,11 @@ class UIMonitoringMixin:
                     "click_number": self.click_count
                 }, success=True)
             else:
-                if hasattr(self, 'last_action_label') and self.last_action_label:
-                    self.last_action_label.config(text="❌ Click failed")
+                self.update_labels(action="❌ Click failed")
                 self.logger.log_error("Click execution failed", "clicker")
                 
         except Exception as e:
-            if hasattr(self, 'last_action_label') and self.last_action_label:
-                self.last_action_label.config(text="❌ Click error")
+            self.update_labels(action="❌ Click error")
             self.logger.log_error(f"Click execution error: {e}", "clicker")
         
         # Reset status after a delay
@@ -396,8 +391,7 @@ class UIMonitoringMixin:
     
     def on_action_cancelled(self):
         """Callback when user cancels the action"""
-        if hasattr(self, 'last_action_label') and self.last_action_label:
-            self.last_action_label.config(text="❌ Action cancelled by user")
+        self.update_labels(action="❌ Action cancelled by user")
         self.status_label.config(text="❌ Action cancelled by user") if hasattr(self, 'status_label') else None
         
         # Log the cancellation
@@ -415,13 +409,51 @@ class UIMonitoringMixin:
             
     def update_monitor_display(self):
         """Update the monitoring display with current status."""
-        if not hasattr(self, 'click_count_label') or not hasattr(self, 'monitor_status_label') or self.monitor_status_label is None:
-            return
-            
         if self.monitor and self.monitor.is_monitoring:
-            self.monitor_status_label.config(text="✅ Monitoring active", foreground="green")
+            self.update_labels(status=("✅ Monitoring active", "green"))
         else:
-            self.monitor_status_label.config(text="⏹️ Not monitoring", foreground="orange")
+            self.update_labels(status=("⏹️ Not monitoring", "orange"))
+
+    def update_labels(self, status=None, count=None, action=None):
+        """Queue monitor label changes and repaint at most every LABEL_UPDATE_INTERVAL.
+        
+        Args:
+            status: (text, foreground) for the monitor status label
+            count: Text for the click count label
+            action: Text for the last action label
+        
+        Later values for the same label replace earlier ones, so a burst of
+        updates costs one Tk config per label. Safe to call from the monitor
+        thread: the shared state is only touched under _label_lock, and the
+        flush itself runs on the Tk thread.
+        """
+        with self._label_lock:
+            for key, value in (('status', status), ('count', count), ('action', action)):
+                if value is not None:
+                    self._pending_label_state[key] = value
+            if self._label_flush_pending:
+                return
+            self._label_flush_pending = True
+            wait = LABEL_UPDATE_INTERVAL - (time.monotonic() - self._last_label_update)
+        # Scheduled outside the lock: from another thread this call waits on the Tk thread
+        if wait <= 0:
+            self.root.after_idle(self._flush_labels)
+        else:
+            self.root.after(int(wait * 1000), self._flush_labels)
+
+    def _flush_labels(self):
+        """Apply the queued label changes."""
+        with self._label_lock:
+            self._label_flush_pending = False
+            self._last_label_update = time.monotonic()
+            pending, self._pending_label_state = self._pending_label_state, {}
+        if 'status' in pending and self.monitor_status_label is not None:
+            text, foreground = pending['status']
+            self.monitor_status_label.config(text=text, foreground=foreground)
+        if 'count' in pending and self.click_count_label is not None:
+            self.click_count_label.config(text=pending['count'])
+        if 'action' in pending and self.last_action_label is not None:
+            self.last_action_label.config(text=pending['action'])
         
     def show_logs_window(self):
         """Show the logs viewing window (legacy method, now switches to monitoring tab)"""